@@ -0,0 +1,81 @@
+from typing import List, Optional
+
+from algorithms.diversity import sampled_hamming
+
+
+class AdaptiveController:
+    """Ajusta taxa de mutação, taxa de crossover e tamanho do torneio a cada geração.
+
+    Usa dois sinais: diversidade genotípica (distância de Hamming média entre pares amostrados,
+    relativa à da primeira geração) e melhora do melhor indivíduo. Enquanto há melhora e diversidade,
+    aumenta a pressão seletiva e o crossover e reduz a mutação; com estagnação ou população convergida
+    sem melhora, volta a explorar, até os valores configurados.
+    """
+
+    def __init__(self, ga, sample_pairs: int = 16, factor: float = 1.5, low: float = 0.05, patience: int = 5) -> None:
+        self.ga = ga
+        self.sample_pairs = int(sample_pairs)
+        self.factor = float(factor)
+        self.low = float(low)
+        self.patience = int(patience)
+        self.base_mutation = ga.mutation_rate
+        self.base_crossover = ga.crossover_rate
+        self.base_tournament = ga.tournament_size
+        # the configured values are the most exploratory setting: going past them only hurt on the benchmark instances
+        self.mutation_bounds = (ga.mutation_rate / 4, ga.mutation_rate)
+        self.crossover_bounds = (ga.crossover_rate, 1.0)
+        self.tournament_bounds = (ga.tournament_size, max(ga.tournament_size, min(ga.pop_size, 2 * ga.tournament_size + 1)))
+        self.initial_diversity: Optional[float] = None
+        self.improvement_rate = 1.0
+        self.stagnation = 0
+
+    def update(self, population: List, improved: bool) -> dict:
+        """Ajusta os parâmetros do AG para a próxima geração e devolve o registro da adaptação."""
+        ga = self.ga
+        diversity = sampled_hamming(population, len(ga.problem), self.sample_pairs)
+        if self.initial_diversity is None:
+            self.initial_diversity = diversity or 1.0
+        relative = diversity / self.initial_diversity
+        self.improvement_rate = 0.7 * self.improvement_rate + 0.3 * improved
+        self.stagnation = 0 if improved else self.stagnation + 1
+
+        if self.stagnation >= self.patience or (relative < self.low and not improved):
+            # stuck, or converged without progress: step back towards the configured values
+            ga.mutation_rate *= self.factor
+            ga.crossover_rate -= 0.05
+            ga.tournament_size -= 1
+        elif improved and relative >= self.low:
+            # progressing with diversity to spare: exploit
+            ga.mutation_rate /= self.factor
+            ga.crossover_rate += 0.05
+            ga.tournament_size += 1
+
+        ga.mutation_rate = min(max(ga.mutation_rate, self.mutation_bounds[0]), self.mutation_bounds[1])
+        ga.crossover_rate = min(max(ga.crossover_rate, self.crossover_bounds[0]), self.crossover_bounds[1])
+        ga.tournament_size = min(max(ga.tournament_size, self.tournament_bounds[0]), self.tournament_bounds[1])
+        return {
+            "diversity": diversity,
+            "improvement_rate": self.improvement_rate,
+            "mutation_rate": ga.mutation_rate,
+            "crossover_rate": ga.crossover_rate,
+            "tournament_size": ga.tournament_size,
+        }
+
+    def state(self) -> dict:
+        ga = self.ga
+        return {
+            "initial_diversity": self.initial_diversity,
+            "improvement_rate": self.improvement_rate,
+            "stagnation": self.stagnation,
+            "mutation_rate": ga.mutation_rate,
+            "crossover_rate": ga.crossover_rate,
+            "tournament_size": ga.tournament_size,
+        }
+
+    def restore(self, state: dict) -> None:
+        self.initial_diversity = state["initial_diversity"]
+        self.improvement_rate = state["improvement_rate"]
+        self.stagnation = state["stagnation"]
+        self.ga.mutation_rate = state["mutation_rate"]
+        self.ga.crossover_rate = state["crossover_rate"]
+        self.ga.tournament_size = state["tournament_size"]
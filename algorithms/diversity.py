@@ -0,0 +1,45 @@
+import math
+import random
+from operator import ne
+from typing import List
+
+
+def genome_key(individual):
+    """Chave hashável do genótipo (a mesma usada pelo FitnessCache)."""
+    bits = getattr(individual, "bits", None)
+    return bits if bits is not None else bytes(individual)
+
+
+def unique_count(population: List) -> int:
+    return len({genome_key(ind) for ind in population})
+
+
+def sampled_hamming(population: List, n: int, pairs: int = 16, rng=random) -> float:
+    """Distância de Hamming média normalizada entre pares aleatórios (0 = população idêntica)."""
+    if n == 0 or len(population) < 2:
+        return 0.0
+    total = 0
+    for _ in range(pairs):
+        a, b = rng.sample(population, 2)
+        if hasattr(a, "bits"):
+            total += (a.bits ^ b.bits).bit_count()
+        else:
+            total += sum(map(ne, a, b))
+    return total / (pairs * n)
+
+
+def gene_entropy(ga, population: List, sample: int = 32, rng=random) -> float:
+    """Entropia binária média por gene (bits), estimada em uma amostra de indivíduos: 1 = genes equilibrados, 0 = fixados."""
+    n = len(ga.problem)
+    if n == 0 or not population:
+        return 0.0
+    rows = population if len(population) <= sample else rng.sample(population, sample)
+    size = len(rows)
+    # share of individuals that select each item (genes may be knapsack numbers > 1)
+    counts = [size - column.count(0) for column in zip(*(ga.genes(ind) for ind in rows))]
+    total = 0.0
+    for c in counts:
+        if 0 < c < size:
+            p = c / size
+            total -= p * math.log2(p) + (1 - p) * math.log2(1 - p)
+    return total / n
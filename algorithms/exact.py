@@ -0,0 +1,187 @@
+import time
+from typing import List, Optional, Tuple
+
+from problem.problem import KnapsackProblem
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional; a DP cai para a versão em Python puro
+    np = None
+
+SOLVERS = ('auto', 'ga', 'dp', 'bnb')
+
+# rough DP throughput (table cells per second) used by choose_solver
+_DP_CELLS_PER_SEC = 2e8 if np is not None else 1.5e7
+# the decision bitset takes n × (capacity + 1) bits
+DP_MAX_BYTES = 512 * 1024 * 1024
+BNB_MAX_ITEMS = 200
+_MULTI_ERROR = 'Os solvers exatos suportam apenas uma dimensão de peso e uma mochila; use o AG.'
+
+
+class DynamicProgrammingSolver:
+    """DP exata com vetor de valores O(capacidade) e bitset de decisões por item para reconstruir a solução."""
+
+    def __init__(self, problem: KnapsackProblem) -> None:
+        if problem.multi:
+            raise ValueError(_MULTI_ERROR)
+        self.problem = problem
+        self.proven_optimal = False
+
+    @staticmethod
+    def memory_bytes(problem: KnapsackProblem) -> int:
+        return len(problem) * ((problem.capacity + 8) // 8)
+
+    def solve(self, max_time: Optional[float] = None) -> Tuple[List[int], int, int]:
+        problem = self.problem
+        capacity = max(0, problem.capacity)
+        weights, values = problem.weights, problem.values
+        start = time.perf_counter()
+        # keep[i] is None when item i never fits; otherwise bit c says "item i taken at capacity c"
+        keep: List = []
+
+        if np is not None:
+            best = np.zeros(capacity + 1, dtype=np.int64)
+            for w, v in zip(weights, values):
+                if w > capacity or v <= 0:
+                    keep.append(None)
+                    continue
+                cand = best[:capacity + 1 - w] + v
+                take = cand > best[w:]
+                best[w:] = np.where(take, cand, best[w:])
+                full = np.zeros(capacity + 1, dtype=bool)
+                full[w:] = take
+                keep.append(np.packbits(full, bitorder='little'))
+                self._check_time(start, max_time)
+        else:
+            best = [0] * (capacity + 1)
+            nbytes = (capacity + 8) // 8
+            for w, v in zip(weights, values):
+                if w > capacity or v <= 0:
+                    keep.append(None)
+                    continue
+                take = bytearray(nbytes)
+                for c in range(capacity, w - 1, -1):
+                    cand = best[c - w] + v
+                    if cand > best[c]:
+                        best[c] = cand
+                        take[c >> 3] |= 1 << (c & 7)
+                keep.append(take)
+                self._check_time(start, max_time)
+
+        individual = [0] * len(problem)
+        c = capacity
+        for i in range(len(problem) - 1, -1, -1):
+            bits = keep[i]
+            if bits is not None and (bits[c >> 3] >> (c & 7)) & 1:
+                individual[i] = 1
+                c -= weights[i]
+
+        self.proven_optimal = True
+        _, total_value, total_weight = problem.evaluate(individual)
+        return individual, total_value, total_weight
+
+    @staticmethod
+    def _check_time(start: float, max_time: Optional[float]) -> None:
+        if max_time is not None and time.perf_counter() - start >= max_time:
+            raise TimeoutError('A programação dinâmica excedeu o tempo máximo.')
+
+
+class BranchAndBoundSolver:
+    """Branch-and-bound em profundidade com limite superior da relaxação fracionária (ordem por razão valor/peso).
+
+    Com max_time ou max_nodes, devolve a melhor solução encontrada; `proven_optimal` indica se a busca terminou.
+    """
+
+    def __init__(self, problem: KnapsackProblem, max_nodes: Optional[int] = None) -> None:
+        if problem.multi:
+            raise ValueError(_MULTI_ERROR)
+        self.problem = problem
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.proven_optimal = False
+
+    def solve(self, max_time: Optional[float] = None) -> Tuple[List[int], int, int]:
+        problem = self.problem
+        capacity = problem.capacity
+        weights, values = problem.weights, problem.values
+        start = time.perf_counter()
+
+        individual = [0] * len(problem)
+        # zero-weight items with positive value are always taken
+        order = []
+        for i in problem.ratio_order:
+            if weights[i] == 0:
+                individual[i] = 1 if values[i] > 0 else 0
+            elif weights[i] <= capacity and values[i] > 0:
+                order.append(i)
+        ws = [weights[i] for i in order]
+        vs = [values[i] for i in order]
+        m = len(order)
+
+        def bound(k: int, cap: int, val: int) -> float:
+            while k < m and ws[k] <= cap:
+                cap -= ws[k]
+                val += vs[k]
+                k += 1
+            if k < m:
+                val += vs[k] * cap / ws[k]
+            return val
+
+        # greedy incumbent
+        best_value, best_taken, cap = 0, [], capacity
+        for k in range(m):
+            if ws[k] <= cap:
+                cap -= ws[k]
+                best_value += vs[k]
+                best_taken.append(k)
+
+        # stack nodes: (next index, remaining capacity, value, taken as linked tuples)
+        stack = [(0, capacity, 0, None)]
+        self.nodes = 0
+        finished = True
+        while stack:
+            k, cap, val, taken = stack.pop()
+            self.nodes += 1
+            if (self.max_nodes is not None and self.nodes > self.max_nodes) or (
+                max_time is not None and not self.nodes & 1023 and time.perf_counter() - start >= max_time
+            ):
+                finished = False
+                break
+            if val > best_value:
+                best_value, best_taken = val, self._unwind(taken)
+            if k >= m or int(bound(k, cap, val)) <= best_value:
+                continue
+            stack.append((k + 1, cap, val, taken))
+            if ws[k] <= cap:
+                # pushed last so the include branch is explored first
+                stack.append((k + 1, cap - ws[k], val + vs[k], (k, taken)))
+
+        self.proven_optimal = finished
+        for k in best_taken:
+            individual[order[k]] = 1
+        _, total_value, total_weight = problem.evaluate(individual)
+        return individual, total_value, total_weight
+
+    @staticmethod
+    def _unwind(taken) -> List[int]:
+        out = []
+        while taken is not None:
+            out.append(taken[0])
+            taken = taken[1]
+        return out
+
+
+def estimate_dp_seconds(problem: KnapsackProblem) -> float:
+    return len(problem) * (problem.capacity + 1) / _DP_CELLS_PER_SEC
+
+
+def choose_solver(problem: KnapsackProblem, max_time: Optional[float] = None) -> str:
+    """Escolhe 'dp', 'bnb' ou 'ga' pelo custo estimado de cada método para a instância."""
+    if problem.multi:
+        return 'ga'
+    budget = max_time if max_time is not None else 5.0
+    if DynamicProgrammingSolver.memory_bytes(problem) <= DP_MAX_BYTES and estimate_dp_seconds(problem) <= budget / 2:
+        return 'dp'
+    if len(problem) <= BNB_MAX_ITEMS:
+        return 'bnb'
+    return 'ga'
@@ -1,9 +1,129 @@
 
 
+import asyncio
+import heapq
+import inspect
+import math
+import os
+import pickle
 import random
 import time
-from typing import List, Tuple, Optional
+import zlib
+from collections import OrderedDict
+from itertools import accumulate, compress
+from operator import mul
+from typing import AsyncIterator, Callable, Iterator, List, Tuple, Optional, Union
 from problem.problem import KnapsackProblem
+from algorithms import operators
+from algorithms.adaptive import AdaptiveController
+from algorithms.diversity import gene_entropy, genome_key, sampled_hamming, unique_count
+from algorithms.history import HISTORY_POLICIES, History, HistorySink
+from algorithms.profiling import PhaseProfiler
+
+
+class FitnessCache:
+    """Memo LRU limitado de genótipo -> (fitness, valor, peso)."""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = int(maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[bytes, Tuple[float, int, int]] = OrderedDict()
+
+    def get(self, key: bytes) -> Optional[Tuple[float, int, int]]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: bytes, entry: Tuple[float, int, int]) -> None:
+        self._data[key] = entry
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class Genome(list):
+    """Lista de genes 0/1 que carrega seu peso e valor totais."""
+
+    __slots__ = ("weight", "value", "_prefix")
+
+    def __init__(self, genes, weight: int, value: int) -> None:
+        super().__init__(genes)
+        self.weight = weight
+        self.value = value
+        self._prefix: Optional[Tuple[List[int], List[int]]] = None
+
+    def clone(self) -> "Genome":
+        return Genome(self, self.weight, self.value)
+
+    def assign(self, other: "Genome") -> None:
+        # overwrite in place, reusing the list storage (same length)
+        self[:] = other
+        self.weight, self.value, self._prefix = other.weight, other.value, None
+
+
+class MultiGenome(Genome):
+    """Genes 0..k (0 = fora, j = mochila j) com a carga de cada mochila em cada dimensão."""
+
+    __slots__ = ("loads",)
+
+    def __init__(self, genes, loads: List[int], weight: int, value: int) -> None:
+        super().__init__(genes, weight, value)
+        self.loads = loads
+
+    def clone(self) -> "MultiGenome":
+        return MultiGenome(self, self.loads[:], self.weight, self.value)
+
+    def assign(self, other: "MultiGenome") -> None:
+        super().assign(other)
+        self.loads[:] = other.loads
+
+
+class BitGenome:
+    """Genes empacotados em um int (bit i = item i), com peso e valor totais."""
+
+    __slots__ = ("bits", "weight", "value")
+
+    def __init__(self, bits: int, weight: int, value: int) -> None:
+        self.bits = bits
+        self.weight = weight
+        self.value = value
+
+    def clone(self) -> "BitGenome":
+        return BitGenome(self.bits, self.weight, self.value)
+
+    def assign(self, other: "BitGenome") -> None:
+        self.bits, self.weight, self.value = other.bits, other.weight, other.value
+
+
+Individual = Union[Genome, MultiGenome, BitGenome]
+REPRESENTATIONS = ("list", "bits")
+SEEDINGS = ("random", "greedy")
+# generational: a new population list each generation; buffered: two preallocated populations, children
+# copied into the slots of the older one; steady_state: only the worst replace_count individuals are replaced
+REPLACEMENTS = ("generational", "buffered", "steady_state")
+_CHECKPOINT_MAGIC = b"KGACKPT1"
+# extra mutation attempts for a duplicate child before replacing it with a fresh individual
+DEDUP_RETRIES = 3
+
+
+def _bit_planes(numbers) -> List[int]:
+    # plane b is a mask of the items whose number has bit b set, so sum(x_i * n_i) = sum(popcount(x & plane_b) << b)
+    nbytes = (len(numbers) + 7) // 8
+    planes = []
+    for b in range(max(numbers, default=0).bit_length()):
+        buf = bytearray(nbytes)
+        for i, x in enumerate(numbers):
+            if (x >> b) & 1:
+                buf[i >> 3] |= 1 << (i & 7)
+        planes.append(int.from_bytes(buf, "little"))
+    return planes
 
 
 class GeneticAlgorithm:
@@ -17,7 +137,36 @@ class GeneticAlgorithm:
         crossover_rate: float = 0.8,
         tournament_size: int = 3,
         elitism: bool = True,
+        cache_size: int = 4096,
+        repair_fill: bool = False,
+        representation: str = "list",
+        profile: bool = False,
+        trace: bool = False,
+        seeding: str = "random",
+        seed_fraction: float = 0.1,
+        adaptive: bool = False,
+        selection: Union[str, Callable] = "tournament",
+        crossover: Union[str, Callable] = "one_point",
+        mutation: Union[str, Callable] = "flip",
+        repair: Union[str, Callable] = "ratio",
+        dedup: bool = False,
+        diversity_metrics: bool = False,
+        restart_threshold: Optional[float] = None,
+        replacement: str = "generational",
+        replace_count: Optional[int] = None,
+        history_limit: Optional[int] = None,
+        history_policy: str = "ring",
     ) -> None:
+        if seeding not in SEEDINGS:
+            raise ValueError(f"Semeadura inválida: {seeding}. Use uma de {', '.join(SEEDINGS)}.")
+        if representation not in REPRESENTATIONS:
+            raise ValueError(f"Representação inválida: {representation}. Use uma de {', '.join(REPRESENTATIONS)}.")
+        if replacement not in REPLACEMENTS:
+            raise ValueError(f"Substituição inválida: {replacement}. Use uma de {', '.join(REPLACEMENTS)}.")
+        if history_policy not in HISTORY_POLICIES:
+            raise ValueError(f"Política de histórico inválida: {history_policy}. Use uma de {', '.join(HISTORY_POLICIES)}.")
+        if problem.multi and representation != "list":
+            raise ValueError("Instâncias com várias dimensões ou mochilas requerem a representação 'list'.")
         self.problem = problem
         self.pop_size = int(pop_size)
         self.generations = int(generations)
@@ -25,72 +174,354 @@ class GeneticAlgorithm:
         self.crossover_rate = float(crossover_rate)
         self.tournament_size = int(tournament_size)
         self.elitism = bool(elitism)
-
-    def _random_individual(self) -> List[int]:
-        return [random.randint(0, 1) for _ in range(len(self.problem.items))]
-
-    def _repair(self, individual: List[int]) -> None:
-        items = self.problem.items
-        capacity = self.problem.capacity
-        total_weight = sum(items[i].weight for i, bit in enumerate(individual) if bit)
-
-        while total_weight > capacity:
-            sel = [i for i, bit in enumerate(individual) if bit]
-            if not sel:
-                break
-            # find item with minimal value/weight ratio
-            worst_idx = min(sel, key=lambda i: items[i].value / items[i].weight if items[i].weight > 0 else float('inf'))
-            individual[worst_idx] = 0
-            total_weight -= items[worst_idx].weight
-
-    def initialize_population(self) -> List[List[int]]:
-        pop = [self._random_individual() for _ in range(self.pop_size)]
+        self.cache = FitnessCache(cache_size) if cache_size > 0 else None
+        self.repair_fill = bool(repair_fill)
+        self.repair_steps = 0
+        self._weights = problem.weights
+        self._values = problem.values
+        self._min_weight = min(self._weights, default=0)
+        self.representation = representation
+        self.seeding = seeding
+        self.seed_fraction = min(1.0, max(0.0, float(seed_fraction)))
+        # multi-dimensional / multiple knapsacks: integer genes and per-knapsack, per-dimension loads
+        self._multi = problem.multi
+        self._bins = problem.bins
+        self._dims = len(problem.dimensions)
+        # greedy seeding also draws random genes with an inclusion probability that fills the knapsack on average
+        totals = [sum(row) for row in problem.dimensions]
+        if seeding == "greedy" and all(totals):
+            capacities = [sum(c) for c in zip(*problem.capacities)]
+            self.init_probability = min(1.0, max(0.0, min(c / t for c, t in zip(capacities, totals))))
+        else:
+            self.init_probability = 0.5
+        if representation == "bits":
+            if min(self._weights, default=0) < 0 or min(self._values, default=0) < 0:
+                raise ValueError("A representação 'bits' requer pesos e valores não negativos.")
+            self._nbytes = (len(problem) + 7) // 8
+            self._weight_planes = _bit_planes(self._weights)
+            self._value_planes = _bit_planes(self._values)
+
+        # pluggable operators (see algorithms/operators.py), bound as methods so the profiler can wrap them
+        self._select = operators.bind(self, selection, operators.SELECTIONS, "seleção")
+        self._crossover = operators.bind(self, crossover, operators.CROSSOVERS, "crossover")
+        # custom crossovers without `out` still work in buffered mode, their children are copied into the slots
+        self._crossover_out = "out" in inspect.signature(self._crossover).parameters
+        self._mutate = operators.bind(self, mutation, operators.MUTATIONS, "mutação")
+        self._repair = operators.bind(self, repair, operators.REPAIRS, "reparo")
+        self._selection_cache = None
+
+        # online tuning of mutation/crossover rates and tournament size, only when asked for
+        self.adapter = AdaptiveController(self) if adaptive else None
+
+        # duplicate elimination, diversity metrics in the history and restart on convergence
+        self.dedup = bool(dedup)
+        self.diversity_metrics = bool(diversity_metrics)
+        self.restart_threshold = float(restart_threshold) if restart_threshold is not None else None
+        self.duplicates = 0
+        self.restarts = 0
+
+        # population replacement scheme; steady_state replaces the worst `replace_count` per generation
+        self.replacement = replacement
+        default_count = max(2, self.pop_size // 10)
+        self.replace_count = min(max(1, int(replace_count or default_count)), max(1, self.pop_size - 1))
+
+        # columnar history, optionally bounded (see algorithms/history.py)
+        self.history_limit = history_limit
+        self.history_policy = history_policy
+        self.history = History()
+
+        self.profiler: Optional[PhaseProfiler] = None
+        if profile or trace:
+            self.profiler = PhaseProfiler(trace=trace)
+            self.profiler.attach(self)
+
+    def genes(self, individual: Individual) -> List[int]:
+        """Genes 0/1 do indivíduo como lista, qualquer que seja a representação."""
+        if isinstance(individual, BitGenome):
+            n = len(self.problem)
+            return [int(c) for c in reversed(format(individual.bits, f"0{n}b"))] if n else []
+        return individual
+
+    def from_genes(self, genes) -> Individual:
+        if self.representation == "bits":
+            return self._bit_genome(int("".join("1" if g else "0" for g in reversed(genes)) or "0", 2))
+        return self._genome(list(genes))
+
+    def _bit_genome(self, bits: int, out: Optional[BitGenome] = None) -> BitGenome:
+        weight = sum((bits & plane).bit_count() << b for b, plane in enumerate(self._weight_planes))
+        value = sum((bits & plane).bit_count() << b for b, plane in enumerate(self._value_planes))
+        if out is None:
+            return BitGenome(bits, weight, value)
+        out.bits, out.weight, out.value = bits, weight, value
+        return out
+
+    def _flip_positions(self, n: int) -> Iterator[int]:
+        # geometric skips between flipped genes: O(flips) random draws instead of one per gene
+        p = self.mutation_rate
+        if p <= 0:
+            return
+        if p >= 1:
+            yield from range(n)
+            return
+        log_q = math.log(1.0 - p)
+        i = -1
+        while True:
+            i += int(math.log(1.0 - random.random()) / log_q) + 1
+            if i >= n:
+                return
+            yield i
+
+    def _genome(self, genes: List[int]) -> Genome:
+        if self._multi:
+            loads = self.problem.loads(genes)
+            return MultiGenome(genes, loads, sum(loads[::self._dims]), sum(compress(self._values, genes)))
+        weight = sum(map(mul, genes, self._weights))
+        value = sum(map(mul, genes, self._values))
+        return Genome(genes, weight, value)
+
+    def _prefix(self, individual: Genome) -> Tuple[List[int], List[int]]:
+        # prefix sums of weight/value, computed lazily once per parent
+        if individual._prefix is None:
+            individual._prefix = (
+                list(accumulate(map(mul, individual, self._weights), initial=0)),
+                list(accumulate(map(mul, individual, self._values), initial=0)),
+            )
+        return individual._prefix
+
+    def _random_individual(self) -> Individual:
+        n = len(self.problem)
+        if self._multi:
+            p, k = self.init_probability, self._bins
+            return self._genome([random.randint(1, k) if random.random() < p else 0 for _ in range(n)])
+        if self.init_probability != 0.5:
+            p = self.init_probability
+            return self.from_genes([1 if random.random() < p else 0 for _ in range(n)])
+        if self.representation == "bits":
+            return self._bit_genome(random.getrandbits(n) if n else 0)
+        return self._genome([random.randint(0, 1) for _ in range(n)])
+
+    def _seed_individuals(self, count: int) -> List[Individual]:
+        """Solução gulosa, arredondamento da relaxação linear e perturbações aleatórias de ambas."""
+        n = len(self.problem)
+        bases = [self.problem.greedy_solution(), self.problem.lp_rounding()]
+        seeds = [self.from_genes(genes) for genes in bases[:count]]
+        while len(seeds) < count and n:
+            genes = list(bases[len(seeds) % 2])
+            for _ in range(random.randint(1, max(1, n // 20))):
+                i = random.randrange(n)
+                if self._bins > 1:
+                    genes[i] = 0 if genes[i] else random.randint(1, self._bins)
+                else:
+                    genes[i] ^= 1
+            seeds.append(self.from_genes(genes))
+        return seeds
+
+    def initialize_population(self) -> List[Individual]:
+        n_seeded = round(self.seed_fraction * self.pop_size) if self.seeding == "greedy" else 0
+        pop = self._seed_individuals(n_seeded)
+        pop += [self._random_individual() for _ in range(self.pop_size - len(pop))]
         for ind in pop:
             self._repair(ind)
         return pop
 
-    def fitness(self, individual: List[int]) -> float:
-        fit, _, _ = self.problem.evaluate(individual)
+    def population_from(self, genomes: List[List[int]]) -> List[Individual]:
+        """População inicial semeada com genomas de outra execução (warm start): reparados, sem repetições
+        e completados com indivíduos novos até pop_size."""
+        pop, seen = [], set()
+        for genes in genomes:
+            if len(pop) >= self.pop_size:
+                break
+            ind = self.from_genes(genes)
+            self._repair(ind)
+            key = genome_key(ind)
+            if key not in seen:
+                seen.add(key)
+                pop.append(ind)
+        fresh = self.initialize_population()
+        return pop + fresh[:self.pop_size - len(pop)]
+
+    def _unique_child(self, child: Individual, seen: set) -> Individual:
+        """Garante que o filho não repita um genótipo da nova geração: muta de novo e, se preciso, sorteia outro."""
+        key = genome_key(child)
+        if key in seen:
+            self.duplicates += 1
+            for _ in range(DEDUP_RETRIES):
+                self._mutate(child)
+                self._repair(child)
+                key = genome_key(child)
+                if key not in seen:
+                    break
+            else:
+                child = self._random_individual()
+                self._repair(child)
+                key = genome_key(child)
+        seen.add(key)
+        return child
+
+    def _breed(
+        self,
+        population: List[Individual],
+        fitnesses: List[float],
+        count: int,
+        seen: Optional[set],
+        targets: Optional[List[Individual]] = None,
+    ) -> Tuple[List[Individual], int, int]:
+        """`count` filhos reparados (seleção, crossover e mutação), com o nº de crossovers e de genes mutados.
+
+        Com `targets`, o crossover escreve cada filho direto no indivíduo correspondente (que não pode ser
+        um dos pais possíveis), e esse indivíduo passa a ser o filho devolvido.
+        """
+        children: List[Individual] = []
+        crossovers = mutations = 0
+        write = targets is not None and self._crossover_out
+
+        def keep(child: Individual) -> None:
+            if seen is not None:
+                child = self._unique_child(child, seen)
+            if targets is not None:
+                slot = targets[len(children)]
+                # a replaced duplicate or a crossover without `out` gives a new object
+                if child is not slot:
+                    slot.assign(child)
+                    child = slot
+            children.append(child)
+
+        while len(children) < count:
+            p1, p2 = self._select(population, fitnesses), self._select(population, fitnesses)
+            if write:
+                k = len(children)
+                # the second child of an odd tail has no slot and is allocated (and dropped) as usual
+                out = (targets[k], targets[k + 1] if k + 1 < count else None)
+                c1, c2, did_cross = self._crossover(p1, p2, out)
+            else:
+                c1, c2, did_cross = self._crossover(p1, p2)
+            crossovers += did_cross
+            mutations += self._mutate(c1) + self._mutate(c2)
+
+            self._repair(c1)
+            keep(c1)
+            if len(children) < count:
+                self._repair(c2)
+                keep(c2)
+        return children, crossovers, mutations
+
+    def diversity(self, population: List[Individual]) -> dict:
+        """Métricas baratas de diversidade: genótipos distintos, Hamming médio amostrado e entropia média por gene."""
+        return {
+            "unique_genomes": unique_count(population),
+            "hamming": sampled_hamming(population, len(self.problem)),
+            "gene_entropy": gene_entropy(self, population),
+        }
+
+    def evaluate(self, individual: Union[Individual, List[int]]) -> Tuple[float, int, int]:
+        # genomes carry their totals, so scoring them is O(1) and cheaper than building the O(n) cache key;
+        # the memo only serves plain gene lists
+        if self.cache is None or isinstance(individual, (Genome, BitGenome)):
+            return self._score(individual)
+        key = bytes(individual)
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = self._score(individual)
+            self.cache.put(key, entry)
+        return entry
+
+    def _score(self, individual: List[int]) -> Tuple[float, int, int]:
+        if isinstance(individual, MultiGenome):
+            return self.problem.score_loads(individual.value, individual.loads)
+        if isinstance(individual, (Genome, BitGenome)):
+            return self.problem.score(individual.value, individual.weight)
+        return self.problem.evaluate(individual)
+
+    def fitness(self, individual: Union[Individual, List[int]]) -> float:
+        fit, _, _ = self.evaluate(individual)
         return fit
 
-    def _tournament_pick(self, population: List[List[int]]) -> List[int]:
-        best = random.choice(population)
-        best_score = self.fitness(best)
-        for _ in range(self.tournament_size - 1):
-            challenger = random.choice(population)
-            score = self.fitness(challenger)
-            if score > best_score:
-                best = challenger
-                best_score = score
-        return best
-
-    def _crossover(self, a: List[int], b: List[int]) -> Tuple[List[int], List[int], bool]:
-        if random.random() > self.crossover_rate or len(a) < 2:
-            return a[:], b[:], False
-        point = random.randrange(1, len(a))
-        return a[:point] + b[point:], b[:point] + a[point:], True
-
-    def _mutate(self, individual: List[int]) -> int:
-        flips = 0
-        for i in range(len(individual)):
-            if random.random() < self.mutation_rate:
-                individual[i] = 1 - individual[i]
-                flips += 1
-        return flips
-
-    def evolve(
+    def save_checkpoint(self, path: str, state: dict) -> None:
+        """Grava o estado do AG (pickle comprimido com zlib) de forma atômica."""
+        state = dict(state, fingerprint=self.problem.fingerprint())
+        payload = _CHECKPOINT_MAGIC + zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+
+    def load_checkpoint(self, path: str) -> dict:
+        with open(path, "rb") as f:
+            payload = f.read()
+        if not payload.startswith(_CHECKPOINT_MAGIC):
+            raise ValueError(f"Arquivo de checkpoint inválido: {path}")
+        state = pickle.loads(zlib.decompress(payload[len(_CHECKPOINT_MAGIC):]))
+        if state.get("fingerprint") != self.problem.fingerprint():
+            raise ValueError("O checkpoint foi gerado para outra instância do problema.")
+        return state
+
+    def evolve(self, *args, **kwargs) -> Tuple[List[int], int, int]:
+        """Executa o AG até um critério de parada; aceita os mesmos parâmetros de iter_evolve."""
+        for _ in self.iter_evolve(*args, **kwargs):
+            pass
+        return self.result
+
+    def request_stop(self) -> None:
+        """Pede o encerramento cooperativo: a execução termina no início da próxima geração."""
+        self._stop_requested = True
+
+    async def aevolve(self, *args, executor=None, **kwargs) -> AsyncIterator[dict]:
+        """Versão assíncrona de iter_evolve: cada geração roda no executor, sem bloquear o event loop.
+
+        Para interromper com `break`, use `contextlib.aclosing(ga.aevolve(...))` para que `self.result` fique pronto.
+        """
+        loop = asyncio.get_running_loop()
+        it = self.iter_evolve(*args, **kwargs)
+        done = object()
+        pending = None
+        try:
+            while True:
+                pending = loop.run_in_executor(executor, next, it, done)
+                # shielded: cancelling the consumer must not drop the generation still running in the executor
+                snapshot = await asyncio.shield(pending)
+                pending = None
+                if snapshot is done:
+                    return
+                yield snapshot
+        finally:
+            self.request_stop()
+            if pending is not None:
+                # cancelled mid-generation: the generator cannot be closed while next() runs in the executor,
+                # so wait for that generation to end (its snapshot is discarded) and then close it here
+                try:
+                    await asyncio.shield(pending)
+                except Exception:
+                    pass
+            # runs iter_evolve's finally block now: final checkpoint, self.result, self.population
+            it.close()
+
+    def iter_evolve(
         self,
         record_history: bool = False,
         max_time: Optional[float] = None,
         show_progress: bool = False,
-    stable_limit: Optional[int] = 15,
-    ) -> Tuple[List[int], int, int]:
-        population = self.initialize_population()
-        best_individual: Optional[List[int]] = None
+        stable_limit: Optional[int] = 15,
+        initial_population: Optional[List[Individual]] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: Optional[int] = None,
+        checkpoint_seconds: Optional[float] = None,
+        resume_from: Optional[str] = None,
+        history_path: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """Gerador de evolve: produz um resumo por geração (gen, best_value, best_weight, avg_fitness, elapsed...).
+
+        O chamador pode parar a qualquer momento (close() ou request_stop()); o melhor resultado até ali
+        fica em `self.result`, assim como `history` e `population`. Com `history_path`, cada registro também é
+        gravado no arquivo (CSV ou JSON Lines, pela extensão) ao fim da geração, com ou sem `record_history`.
+        """
+        self._stop_requested = False
+        best_individual: Optional[Individual] = None
         best_fitness = float("-inf")
+        best_value = best_weight = 0
 
-        history = []
+        history = History(self.history_limit, self.history_policy)
         start_time = time.perf_counter()
+        elapsed_offset = 0.0
 
         gen = 0
         stable_count = 0
@@ -99,60 +530,155 @@ class GeneticAlgorithm:
         # If stable_limit is provided and positive, allow potentially unlimited runs
         use_stable = stable_limit is not None and stable_limit > 0
 
-        while True:
-            if not use_stable and gen >= self.generations:
-                break
-
-            elapsed_since_start = time.perf_counter() - start_time
-            if show_progress:
-                bf = f"{best_fitness:.2f}" if best_fitness != float("-inf") else "-"
-                print(f"\rGeração {gen+1}/{self.generations} — decorrido: {elapsed_since_start:.2f}s — melhor: {bf}", end="", flush=True)
-
-            if max_time is not None and elapsed_since_start >= max_time:
-                break
-
-            gen_mutations = 0
-            gen_crossovers = 0
-
-            fitnesses = [self.fitness(ind) for ind in population]
-            avg_fitness = sum(fitnesses) / len(fitnesses)
-
-            improved = False
-            for ind, f in zip(population, fitnesses):
-                if f > best_fitness:
-                    best_fitness, best_individual, improved = f, ind[:], True
-
-            new_pop: List[List[int]] = []
-            if self.elitism and best_individual is not None:
-                elite = best_individual[:]
-                self._repair(elite)
-                new_pop.append(elite)
-
-            while len(new_pop) < self.pop_size:
-                p1, p2 = self._tournament_pick(population), self._tournament_pick(population)
-                c1, c2, did_cross = self._crossover(p1, p2)
-                gen_crossovers += did_cross
-                gen_mutations += self._mutate(c1) + self._mutate(c2)
-                
-                self._repair(c1)
-                new_pop.append(c1)
-                if len(new_pop) < self.pop_size:
-                    self._repair(c2)
-                    new_pop.append(c2)
-
-            # stability tracking based on best VALUE (not fitness)
-            best_value_now = self.problem.evaluate(best_individual)[1] if best_individual else 0
-            
-            if prev_best_value is None:
-                prev_best_value, stable_count = best_value_now, 0
-            elif best_value_now == prev_best_value and not improved:
-                stable_count += 1
-            elif best_value_now != prev_best_value:
-                prev_best_value, stable_count = best_value_now, 0
-
-            if record_history:
-                _, best_value, best_weight = self.problem.evaluate(best_individual) if best_individual else (0, 0, 0)
-                history.append({
+        if resume_from is not None:
+            state = self.load_checkpoint(resume_from)
+            population = [self.from_genes(genes) for genes in state["population"]]
+            if state["best"] is not None:
+                best_individual = self.from_genes(state["best"])
+                best_fitness, best_value, best_weight = state["best_fitness"], state["best_value"], state["best_weight"]
+            gen, stable_count, prev_best_value = state["gen"], state["stable_count"], state["prev_best_value"]
+            history = state["history"]
+            if not isinstance(history, History):
+                # checkpoints written before the columnar history
+                history = History.from_records(history, self.history_limit, self.history_policy)
+            elapsed_offset = state["elapsed"]
+            self.repair_steps = state["repair_steps"]
+            self.restarts = state.get("restarts", 0)
+            random.setstate(state["rng"])
+            if self.adapter is not None and state.get("adaptive"):
+                self.adapter.restore(state["adaptive"])
+            # resuming a run that had already converged means "keep going"
+            if use_stable and stable_count >= stable_limit:
+                stable_count = 0
+        else:
+            population = initial_population if initial_population is not None else self.initialize_population()
+
+        def checkpoint_state() -> dict:
+            return {
+                "population": [bytes(self.genes(ind)) for ind in population],
+                "best": bytes(self.genes(best_individual)) if best_individual is not None else None,
+                "best_fitness": best_fitness,
+                "best_value": best_value,
+                "best_weight": best_weight,
+                "gen": gen,
+                "stable_count": stable_count,
+                "prev_best_value": prev_best_value,
+                "history": history,
+                "elapsed": elapsed_offset + time.perf_counter() - start_time,
+                "repair_steps": self.repair_steps,
+                "restarts": self.restarts,
+                "rng": random.getstate(),
+                "adaptive": self.adapter.state() if self.adapter is not None else None,
+            }
+
+        last_checkpoint = time.perf_counter()
+        # buffered: slots of the previous generation, overwritten by the next one's children
+        spare: Optional[List[Individual]] = None
+        # steady_state: scores persist between generations and only the replaced slots are re-evaluated
+        scores: Optional[List[Tuple[float, int, int]]] = None
+        stale: List[int] = []
+
+        sink = HistorySink(history_path, append=resume_from is not None) if history_path else None
+
+        try:
+            while True:
+                if self._stop_requested or (not use_stable and gen >= self.generations):
+                    break
+
+                elapsed_since_start = time.perf_counter() - start_time
+                if show_progress:
+                    bf = f"{best_fitness:.2f}" if best_fitness != float("-inf") else "-"
+                    print(f"\rGeração {gen+1}/{self.generations} — decorrido: {elapsed_since_start:.2f}s — melhor: {bf}", end="", flush=True)
+
+                if max_time is not None and elapsed_since_start >= max_time:
+                    break
+
+                repair_before = self.repair_steps
+                hits_before = self.cache.hits if self.cache else 0
+                misses_before = self.cache.misses if self.cache else 0
+                duplicates_before = self.duplicates
+
+                if self.replacement == "steady_state" and scores is not None:
+                    for i in stale:
+                        scores[i] = self.evaluate(population[i])
+                else:
+                    scores = [self.evaluate(ind) for ind in population]
+                fitnesses = [sc[0] for sc in scores]
+                avg_fitness = sum(fitnesses) / len(fitnesses)
+
+                improved = False
+                for ind, (f, v, w) in zip(population, scores):
+                    if f > best_fitness:
+                        best_fitness, best_individual, improved = f, ind.clone(), True
+                        best_value, best_weight = v, w
+
+                # rates for the offspring of this generation
+                adaptation = self.adapter.update(population, improved) if self.adapter else None
+
+                metrics = None
+                if self.diversity_metrics:
+                    metrics = self.diversity(population)
+                elif self.restart_threshold is not None:
+                    metrics = {"hamming": sampled_hamming(population, len(self.problem))}
+
+                seen = set() if self.dedup else None
+                if self.replacement == "steady_state":
+                    # the current best is left out explicitly: with tied fitnesses it could be among the worst
+                    top = max(range(len(population)), key=fitnesses.__getitem__)
+                    candidates = [i for i in range(len(population)) if i != top]
+                    stale = heapq.nsmallest(self.replace_count, candidates, key=fitnesses.__getitem__)
+                    if seen is not None:
+                        replaced = set(stale)
+                        seen.update(genome_key(ind) for i, ind in enumerate(population) if i not in replaced)
+                    children, gen_crossovers, gen_mutations = self._breed(population, fitnesses, len(stale), seen)
+                    for i, child in zip(stale, children):
+                        population[i].assign(child)
+                    new_pop = population
+                else:
+                    # buffered: from the second generation on, write into the slots of the generation before last
+                    slots = spare if self.replacement == "buffered" and spare is not None and len(spare) == self.pop_size else None
+                    elite = None
+                    if self.elitism and best_individual is not None:
+                        if slots is not None:
+                            elite = slots[0]
+                            elite.assign(best_individual)
+                        else:
+                            elite = best_individual.clone()
+                        self._repair(elite)
+                        if seen is not None:
+                            seen.add(genome_key(elite))
+                    offset = elite is not None
+                    targets = slots[offset:] if slots is not None else None
+                    children, gen_crossovers, gen_mutations = self._breed(population, fitnesses, self.pop_size - offset, seen, targets)
+                    if slots is not None:
+                        new_pop = slots
+                    else:
+                        new_pop = [elite] + children if elite is not None else children
+                    if self.replacement == "buffered":
+                        spare = population
+
+                # converged population: keep the best and start over from a fresh one
+                restarted = False
+                if self.restart_threshold is not None and metrics["hamming"] < self.restart_threshold:
+                    fresh = self.initialize_population()
+                    new_pop = ([best_individual.clone()] + fresh[1:]) if best_individual is not None else fresh
+                    self.restarts += 1
+                    restarted = True
+                    scores = None
+
+                # stability tracking based on best VALUE (not fitness)
+                best_value_now = best_value
+
+                if prev_best_value is None:
+                    prev_best_value, stable_count = best_value_now, 0
+                elif best_value_now == prev_best_value and not improved:
+                    stable_count += 1
+                elif best_value_now != prev_best_value:
+                    prev_best_value, stable_count = best_value_now, 0
+
+                phase_stats = self.profiler.end_generation(gen) if self.profiler else None
+
+                record = {
                     "gen": gen,
                     "best_fitness": best_fitness,
                     "avg_fitness": avg_fitness,
@@ -160,21 +686,56 @@ class GeneticAlgorithm:
                     "crossovers": gen_crossovers,
                     "best_value": best_value,
                     "best_weight": best_weight,
-                    "elapsed": time.perf_counter() - start_time,
-                })
-
-            population = new_pop
-            gen += 1
+                    "repair_steps": self.repair_steps - repair_before,
+                    "cache_hits": (self.cache.hits - hits_before) if self.cache else 0,
+                    "cache_misses": (self.cache.misses - misses_before) if self.cache else 0,
+                    "elapsed": elapsed_offset + time.perf_counter() - start_time,
+                }
+                if adaptation:
+                    record.update(adaptation)
+                if metrics and self.diversity_metrics:
+                    record.update(metrics)
+                if self.dedup:
+                    record["duplicates"] = self.duplicates - duplicates_before
+                if self.restart_threshold is not None:
+                    record["restarted"] = restarted
+                if phase_stats:
+                    record.update(phase_stats)
+                if record_history:
+                    history.append(record)
+
+                population = new_pop
+                gen += 1
+
+                if checkpoint_path is not None and (
+                    (checkpoint_every and gen % checkpoint_every == 0)
+                    or (checkpoint_seconds and time.perf_counter() - last_checkpoint >= checkpoint_seconds)
+                ):
+                    self.save_checkpoint(checkpoint_path, checkpoint_state())
+                    last_checkpoint = time.perf_counter()
+
+                if sink is not None:
+                    sink.write(record)
+
+                yield record
+
+                if use_stable and stable_count >= stable_limit:
+                    break
+        finally:
+            # also runs when the caller closes the generator early
+            if sink is not None:
+                sink.close()
+            if checkpoint_path is not None:
+                self.save_checkpoint(checkpoint_path, checkpoint_state())
+
+            if best_individual is None:
+                best_individual = self.from_genes([0] * len(self.problem))
+            _, total_value, total_weight = self.evaluate(best_individual)
+            self.history = history if record_history else History()
+            self.population = population
+            self.generations_run = gen
+            self.result = (self.genes(best_individual), total_value, total_weight)
 
-            if use_stable and stable_count >= stable_limit:
-                break
-
-        best_individual = best_individual or [0] * len(self.problem.items)
-        _, total_value, total_weight = self.problem.evaluate(best_individual)
-        self.history = history if record_history else []
-        
-        if show_progress:
-            print()
-
-        return best_individual, total_value, total_weight
+            if show_progress:
+                print()
 
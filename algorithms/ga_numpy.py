@@ -0,0 +1,188 @@
+import time
+from typing import List, Tuple, Optional
+
+from problem.problem import KnapsackProblem
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional; o motor baseado em listas continua disponível
+    np = None
+
+
+class NumpyGeneticAlgorithm:
+    """Variante vetorizada do AG: a população é uma matriz uint8 (pop_size × n_items)."""
+
+    def __init__(
+        self,
+        problem: KnapsackProblem,
+        pop_size: int = 100,
+        generations: int = 200,
+        mutation_rate: float = 0.01,
+        crossover_rate: float = 0.8,
+        tournament_size: int = 3,
+        elitism: bool = True,
+        seed: Optional[int] = None,
+    ) -> None:
+        if np is None:
+            raise RuntimeError("O motor 'numpy' requer o pacote numpy instalado (pip install numpy).")
+        if problem.multi:
+            raise ValueError("O motor 'numpy' suporta apenas uma dimensão de peso e uma mochila; use o motor list.")
+        self.problem = problem
+        self.pop_size = int(pop_size)
+        self.generations = int(generations)
+        self.mutation_rate = float(mutation_rate)
+        self.crossover_rate = float(crossover_rate)
+        self.tournament_size = int(tournament_size)
+        self.elitism = bool(elitism)
+        self.rng = np.random.default_rng(seed)
+        self.history: list = []
+
+        self.weights = np.asarray(problem.weights, dtype=np.int64)
+        self.values = np.asarray(problem.values, dtype=np.int64)
+        # worst value/weight ratio first, the order in which repair drops items
+        self._repair_order = np.array(problem.ratio_order[::-1], dtype=np.int64)
+
+    def _random_population(self, rows: int):
+        return self.rng.integers(0, 2, size=(rows, len(self.weights)), dtype=np.uint8)
+
+    def _repair(self, pop) -> None:
+        totals = pop @ self.weights
+        over = np.nonzero(totals > self.problem.capacity)[0]
+        if over.size == 0:
+            return
+        order = self._repair_order
+        sub = pop[over][:, order]
+        excess = totals[over] - self.problem.capacity
+        removed_before = np.cumsum(sub * self.weights[order], axis=1) - sub * self.weights[order]
+        # same items the sequential greedy removes: selected ones until the excess is covered
+        drop = (sub == 1) & (removed_before < excess[:, None])
+        sub[drop] = 0
+        rows = pop[over]
+        rows[:, order] = sub
+        pop[over] = rows
+
+    def initialize_population(self):
+        pop = self._random_population(self.pop_size)
+        self._repair(pop)
+        return pop
+
+    def evaluate_population(self, pop):
+        weights = pop @ self.weights
+        values = pop @ self.values
+        fitness = np.where(weights <= self.problem.capacity, values.astype(np.float64), -1e9)
+        return fitness, values, weights
+
+    def _tournament_pick(self, fitnesses, count: int):
+        contestants = self.rng.integers(0, len(fitnesses), size=(count, self.tournament_size))
+        winners = np.argmax(fitnesses[contestants], axis=1)
+        return contestants[np.arange(count), winners]
+
+    def _crossover(self, a, b):
+        pairs, n = a.shape
+        if n < 2:
+            return a.copy(), b.copy(), 0
+        do_cross = self.rng.random(pairs) <= self.crossover_rate
+        points = self.rng.integers(1, n, size=pairs)
+        mask = (np.arange(n)[None, :] < points[:, None]) | ~do_cross[:, None]
+        c1 = np.where(mask, a, b)
+        c2 = np.where(mask, b, a)
+        return c1, c2, int(do_cross.sum())
+
+    def _mutate(self, pop) -> int:
+        flips = self.rng.random(pop.shape) < self.mutation_rate
+        pop ^= flips.astype(np.uint8)
+        return int(flips.sum())
+
+    def evolve(
+        self,
+        record_history: bool = False,
+        max_time: Optional[float] = None,
+        show_progress: bool = False,
+        stable_limit: Optional[int] = 15,
+    ) -> Tuple[List[int], int, int]:
+        population = self.initialize_population()
+        best_individual = None
+        best_fitness = float("-inf")
+
+        history = []
+        start_time = time.perf_counter()
+
+        gen = 0
+        stable_count = 0
+        prev_best_value = None
+
+        use_stable = stable_limit is not None and stable_limit > 0
+
+        while True:
+            if not use_stable and gen >= self.generations:
+                break
+
+            elapsed_since_start = time.perf_counter() - start_time
+            if show_progress:
+                bf = f"{best_fitness:.2f}" if best_fitness != float("-inf") else "-"
+                print(f"\rGeração {gen+1}/{self.generations} — decorrido: {elapsed_since_start:.2f}s — melhor: {bf}", end="", flush=True)
+
+            if max_time is not None and elapsed_since_start >= max_time:
+                break
+
+            fitnesses, values, weights = self.evaluate_population(population)
+            avg_fitness = float(fitnesses.mean())
+
+            improved = False
+            top = int(np.argmax(fitnesses))
+            if fitnesses[top] > best_fitness:
+                best_fitness = float(fitnesses[top])
+                best_individual = population[top].copy()
+                best_value, best_weight = int(values[top]), int(weights[top])
+                improved = True
+
+            n_elite = 1 if self.elitism and best_individual is not None else 0
+            n_children = self.pop_size - n_elite
+            pairs = (n_children + 1) // 2
+
+            parents = self._tournament_pick(fitnesses, 2 * pairs)
+            c1, c2, gen_crossovers = self._crossover(population[parents[:pairs]], population[parents[pairs:]])
+            children = np.concatenate((c1, c2))[:n_children]
+            gen_mutations = self._mutate(children)
+            self._repair(children)
+
+            if n_elite:
+                children = np.concatenate((best_individual[None, :], children))
+
+            best_value_now = best_value if best_individual is not None else 0
+
+            if prev_best_value is None:
+                prev_best_value, stable_count = best_value_now, 0
+            elif best_value_now == prev_best_value and not improved:
+                stable_count += 1
+            elif best_value_now != prev_best_value:
+                prev_best_value, stable_count = best_value_now, 0
+
+            if record_history:
+                history.append({
+                    "gen": gen,
+                    "best_fitness": best_fitness,
+                    "avg_fitness": avg_fitness,
+                    "mutations": gen_mutations,
+                    "crossovers": gen_crossovers,
+                    "best_value": best_value if best_individual is not None else 0,
+                    "best_weight": best_weight if best_individual is not None else 0,
+                    "elapsed": time.perf_counter() - start_time,
+                })
+
+            population = children
+            gen += 1
+
+            if use_stable and stable_count >= stable_limit:
+                break
+
+        if best_individual is None:
+            best_individual = np.zeros(len(self.weights), dtype=np.uint8)
+        best_list = best_individual.tolist()
+        _, total_value, total_weight = self.problem.evaluate(best_list)
+        self.history = history if record_history else []
+
+        if show_progress:
+            print()
+
+        return best_list, total_value, total_weight
@@ -0,0 +1,184 @@
+import csv
+import json
+import math
+import os
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+HISTORY_POLICIES = ("ring", "downsample")
+HISTORY_FORMATS = ("csv", "jsonl")
+
+# empty cell of each column kind, for records that lack a key
+_DEFAULTS = {"q": 0, "d": math.nan}
+
+
+class History:
+    """Histórico por geração guardado em colunas (`array('q')` para inteiros e booleanos, `array('d')` para reais).
+
+    Sem `limit`, guarda todos os registros. Com `limit` e policy="ring", guarda só os `limit` mais recentes;
+    com policy="downsample", guarda no máximo `limit` registros espaçados ao longo de toda a execução (ao
+    encher, descarta um a cada dois e dobra o passo). Indexar ou iterar devolve dicts, como a lista antiga.
+    """
+
+    def __init__(self, limit: Optional[int] = None, policy: str = "ring") -> None:
+        if policy not in HISTORY_POLICIES:
+            raise ValueError(f"Política de histórico inválida: {policy}. Use uma de {', '.join(HISTORY_POLICIES)}.")
+        self.limit = max(2, int(limit)) if limit else None
+        self.policy = policy
+        # downsample: only every stride-th offered record is stored
+        self.stride = 1
+        self.total = 0
+        self._columns: Dict[str, Union[array, list]] = {}
+        self._bools: set = set()
+        self._size = 0
+        # ring: physical position of the oldest record once the buffer is full
+        self._head = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(self._size):
+            yield self._record(self._position(i))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(self._position(i)) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("índice fora do histórico")
+        return self._record(self._position(index))
+
+    def __repr__(self) -> str:
+        return f"History({self._size} registros de {self.total}, colunas={list(self._columns)})"
+
+    def keys(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, key: str) -> list:
+        """Valores de uma coluna em ordem cronológica."""
+        values = self._columns[key]
+        ordered = [values[self._position(i)] for i in range(self._size)]
+        return [bool(v) for v in ordered] if key in self._bools else ordered
+
+    def records(self) -> List[dict]:
+        return list(self)
+
+    def extend(self, records: Iterable[dict]) -> None:
+        for record in records:
+            self.append(record)
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict], limit: Optional[int] = None, policy: str = "ring") -> "History":
+        history = cls(limit, policy)
+        history.extend(records)
+        return history
+
+    def append(self, record: dict) -> None:
+        self.total += 1
+        if self.policy == "downsample" and (self.total - 1) % self.stride:
+            return
+        if self.limit is not None and self._size == self.limit:
+            if self.policy == "ring":
+                self._write(record, self._head)
+                self._head = (self._head + 1) % self.limit
+                return
+            # keep every other stored record: they stay evenly spaced with twice the stride
+            for key, values in self._columns.items():
+                self._columns[key] = values[::2]
+            self._size = (self._size + 1) // 2
+            self.stride *= 2
+            if (self.total - 1) % self.stride:
+                return
+        self._write(record, None)
+        self._size += 1
+
+    def _position(self, i: int) -> int:
+        return (self._head + i) % self._size if self._head else i
+
+    def _record(self, pos: int) -> dict:
+        record = {}
+        for key, values in self._columns.items():
+            value = values[pos]
+            record[key] = bool(value) if key in self._bools else value
+        return record
+
+    def _new_column(self, key: str, value) -> None:
+        if isinstance(value, bool):
+            self._bools.add(key)
+        if isinstance(value, int):
+            column = array("q", [0]) * self._size
+        elif isinstance(value, float):
+            column = array("d", [math.nan]) * self._size
+        else:
+            column = [None] * self._size
+        self._columns[key] = column
+
+    def _write(self, record: dict, pos: Optional[int]) -> None:
+        # pos None appends a new row; otherwise the row at pos is overwritten (ring buffer)
+        for key, value in record.items():
+            if key not in self._columns:
+                self._new_column(key, value)
+        for key, values in self._columns.items():
+            value = record.get(key)
+            if value is None and isinstance(values, array):
+                value = _DEFAULTS[values.typecode]
+            try:
+                if pos is None:
+                    values.append(value)
+                else:
+                    values[pos] = value
+            except (TypeError, OverflowError):
+                # a float in an integer column, or a value that does not fit: widen the column and retry
+                widened = array("d", values) if values.typecode == "q" and isinstance(value, float) else list(values)
+                self._columns[key] = widened
+                if pos is None:
+                    widened.append(value)
+                else:
+                    widened[pos] = value
+
+
+class HistorySink:
+    """Grava cada registro no arquivo assim que é produzido, em CSV ou JSON Lines (pela extensão, se `fmt` for None).
+
+    O CSV usa as colunas do primeiro registro; JSON Lines grava cada registro completo. Com `append`, continua um
+    arquivo existente (o CSV reaproveita o cabeçalho que já está nele).
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None, append: bool = False) -> None:
+        fmt = fmt or ("csv" if path.lower().endswith(".csv") else "jsonl")
+        if fmt not in HISTORY_FORMATS:
+            raise ValueError(f"Formato de histórico inválido: {fmt}. Use um de {', '.join(HISTORY_FORMATS)}.")
+        self.path = path
+        self.format = fmt
+        self.written = 0
+        fieldnames = None
+        if append and fmt == "csv" and os.path.exists(path) and os.path.getsize(path):
+            with open(path, newline="", encoding="utf-8") as f:
+                fieldnames = next(csv.reader(f), None)
+        self._file = open(path, "a" if append else "w", newline="" if fmt == "csv" else None, encoding="utf-8")
+        self._writer = None
+        if fieldnames:
+            self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction="ignore")
+
+    def write(self, record: dict) -> None:
+        if self.format == "jsonl":
+            self._file.write(json.dumps(record, ensure_ascii=False))
+            self._file.write("\n")
+        else:
+            if self._writer is None:
+                self._writer = csv.DictWriter(self._file, fieldnames=list(record), extrasaction="ignore")
+                self._writer.writeheader()
+            self._writer.writerow(record)
+        self.written += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "HistorySink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
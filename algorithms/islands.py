@@ -0,0 +1,184 @@
+import multiprocessing as mp
+import random
+import time
+from array import array
+from typing import List, Optional, Tuple
+
+from problem.problem import KnapsackProblem
+from algorithms.ga import GeneticAlgorithm
+from algorithms.history import History
+
+TOPOLOGIES = ('ring', 'full')
+
+
+def _island_worker(conn, weights, values, capacities, extra_weights, ga_kwargs: dict, seed: Optional[int]) -> None:
+    """Processo de uma ilha: mantém sua população e evolui K gerações por comando recebido."""
+    random.seed(seed)
+    problem = KnapsackProblem.from_arrays(weights, values, capacities, extra_weights=extra_weights)
+    ga = GeneticAlgorithm(problem, **ga_kwargs)
+    population = ga.initialize_population()
+    gens_done = 0
+    elapsed_done = 0.0
+
+    while True:
+        msg = conn.recv()
+        if msg is None:
+            break
+        immigrants, generations, max_time, migrants, record_history = msg
+
+        if immigrants:
+            # immigrants replace the worst individuals, never the whole population
+            population.sort(key=ga.fitness)
+            incoming = [ga.from_genes(genes) for genes in immigrants[:len(population) - 1]]
+            for ind in incoming:
+                ga._repair(ind)
+            population[:len(incoming)] = incoming
+
+        ga.generations = generations
+        epoch_start = time.perf_counter()
+        best, value, weight = ga.evolve(record_history=record_history, max_time=max_time, stable_limit=None, initial_population=population)
+        population = ga.population
+
+        # epoch records are rebuilt from the columnar history with run-wide generation and time
+        history = [dict(rec, gen=rec['gen'] + gens_done, elapsed=rec['elapsed'] + elapsed_done) for rec in ga.history]
+        gens_done += ga.generations_run
+        elapsed_done += time.perf_counter() - epoch_start
+
+        top = sorted(population, key=ga.fitness, reverse=True)[:migrants]
+        conn.send((bytes(best), value, weight, [bytes(ga.genes(g)) for g in top], history, ga.generations_run))
+
+    conn.close()
+
+
+class IslandModel:
+    """AG em modelo de ilhas: N populações em processos separados com migração periódica."""
+
+    def __init__(
+        self,
+        problem: KnapsackProblem,
+        islands: int = 4,
+        migration_interval: int = 10,
+        migrants: int = 2,
+        topology: str = 'ring',
+        seed: Optional[int] = None,
+        generations: int = 200,
+        **ga_kwargs,
+    ) -> None:
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Topologia inválida: {topology}. Use uma de {', '.join(TOPOLOGIES)}.")
+        self.problem = problem
+        self.islands = max(1, int(islands))
+        self.migration_interval = max(1, int(migration_interval))
+        self.migrants = max(0, int(migrants))
+        self.topology = topology
+        self.seed = seed if seed is not None else random.randrange(2 ** 31)
+        self.generations = int(generations)
+        self.ga_kwargs = ga_kwargs
+        self.history: list = []
+        self.island_histories: List[History] = []
+
+    def _destinations(self, src: int) -> List[int]:
+        if self.islands == 1:
+            return []
+        if self.topology == 'ring':
+            return [(src + 1) % self.islands]
+        return [dst for dst in range(self.islands) if dst != src]
+
+    def evolve(
+        self,
+        record_history: bool = False,
+        max_time: Optional[float] = None,
+        show_progress: bool = False,
+        stable_limit: Optional[int] = 15,
+    ) -> Tuple[List[int], int, int]:
+        ctx = mp.get_context()
+        # item data lives in shared memory; workers read it instead of receiving a pickled copy
+        weights = ctx.RawArray('q', len(self.problem))
+        values = ctx.RawArray('q', len(self.problem))
+        weights[:] = self.problem.weights
+        values[:] = self.problem.values
+        extra_weights = [array('q', row) for row in self.problem.dimensions[1:]]
+
+        conns, procs = [], []
+        for i in range(self.islands):
+            parent_conn, child_conn = ctx.Pipe()
+            proc = ctx.Process(
+                target=_island_worker,
+                args=(child_conn, weights, values, self.problem.capacities, extra_weights, self.ga_kwargs, self.seed + i),
+                daemon=True,
+            )
+            proc.start()
+            child_conn.close()
+            conns.append(parent_conn)
+            procs.append(proc)
+
+        use_stable = stable_limit is not None and stable_limit > 0
+        start_time = time.perf_counter()
+        best_genes: Optional[bytes] = None
+        best_value = 0
+        # each island's history obeys the same bound as inside the workers
+        limit, policy = self.ga_kwargs.get('history_limit'), self.ga_kwargs.get('history_policy', 'ring')
+        island_histories: List[History] = [History(limit, policy) for _ in range(self.islands)]
+        inbox: List[List[bytes]] = [[] for _ in range(self.islands)]
+        gen = 0
+        stable_count = 0
+
+        try:
+            while True:
+                if not use_stable and gen >= self.generations:
+                    break
+                elapsed = time.perf_counter() - start_time
+                if max_time is not None and elapsed >= max_time:
+                    break
+
+                step = self.migration_interval
+                if not use_stable:
+                    step = min(step, self.generations - gen)
+                remaining = None if max_time is None else max_time - elapsed
+
+                for i, conn in enumerate(conns):
+                    conn.send((inbox[i], step, remaining, self.migrants, record_history))
+                results = [conn.recv() for conn in conns]
+
+                inbox = [[] for _ in range(self.islands)]
+                prev_best_value = best_value if best_genes is not None else None
+                for i, (genes, value, _, emigrants, hist, _) in enumerate(results):
+                    island_histories[i].extend(hist)
+                    for dst in self._destinations(i):
+                        inbox[dst].extend(emigrants)
+                    if best_genes is None or value > best_value:
+                        best_genes, best_value = genes, value
+
+                # stop criteria are global: generations without improvement of the best over all islands
+                ran = max(r[5] for r in results)
+                gen += ran
+                if prev_best_value is None or best_value > prev_best_value:
+                    stable_count = 0
+                else:
+                    stable_count += ran
+
+                if show_progress:
+                    print(f"\rGeração {gen} — decorrido: {time.perf_counter() - start_time:.2f}s — melhor: {best_value}", end="", flush=True)
+
+                if ran == 0 or (use_stable and stable_count >= stable_limit):
+                    break
+        finally:
+            for conn in conns:
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+            for proc in procs:
+                proc.join(timeout=5)
+
+        best_individual = list(best_genes) if best_genes is not None else [0] * len(self.problem)
+        _, total_value, total_weight = self.problem.evaluate(best_individual)
+
+        self.island_histories = island_histories if record_history else []
+        self.history = [dict(rec, island=i) for i, hist in enumerate(self.island_histories) for rec in hist]
+        self.generations_run = gen
+
+        if show_progress:
+            print()
+
+        return best_individual, total_value, total_weight
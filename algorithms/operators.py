@@ -0,0 +1,476 @@
+import math
+import random
+from itertools import compress
+from types import MethodType
+from typing import Callable, Dict, List, Tuple, Union
+
+# Strategies are plain functions whose first argument is the GeneticAlgorithm; the GA binds the chosen
+# ones as its _select/_crossover/_mutate/_repair methods. Any function with the same signature can be
+# passed instead of a name. Crossovers may also take `out`, a pair of existing genomes (or None) that the
+# children are written into instead of allocating new ones.
+
+# fraction of the population (best first) that truncation selection draws from
+TRUNCATION_FRACTION = 0.5
+
+
+# byte value -> its 8 bits as 0/1 bytes, least significant first
+_SPREAD = [bytes((byte >> k) & 1 for k in range(8)) for byte in range(256)]
+
+
+def _is_bits(ga) -> bool:
+    return ga.representation == "bits"
+
+
+_NO_OUT = (None, None)
+
+
+def _splice(base, other, p: int, q: int, slot):
+    # base's genes with other's in [p, q): a new list, or written over the slot's own storage
+    if slot is None:
+        return base[:p] + other[p:q] + base[q:]
+    slot[:] = base
+    slot[p:q] = other[p:q]
+    return slot
+
+
+def _filled(genes, slot):
+    # genes as a new list, or copied into the slot's storage
+    if slot is None:
+        return list(genes)
+    slot[:] = genes
+    return slot
+
+
+def _made(genome, genes, weight: int, value: int, loads=None):
+    # wrap new genes in a genome, or finish a slot whose genes were already written in place
+    if isinstance(genes, genome):
+        genes.weight, genes.value, genes._prefix = weight, value, None
+        if loads is not None:
+            genes.loads = loads
+        return genes
+    return genome(genes, weight, value) if loads is None else genome(genes, loads, weight, value)
+
+
+def _copied(individual, slot):
+    if slot is None:
+        return individual.clone()
+    slot.assign(individual)
+    return slot
+
+
+def _multi_children(ga, a, b, g1: List[int], g2: List[int]) -> Tuple:
+    # multi-dimensional genomes: loads, weight and value are additive, so child 2 is the parents minus child 1
+    genome = type(a)
+    loads1 = ga.problem.loads(g1)
+    c1 = _made(genome, g1, sum(loads1[::ga._dims]), sum(compress(ga._values, g1)), loads1)
+    loads2 = [x + y - z for x, y, z in zip(a.loads, b.loads, loads1)]
+    return c1, _made(genome, g2, a.weight + b.weight - c1.weight, a.value + b.value - c1.value, loads2)
+
+
+def _exchange(ga, a, b, p: int, q: int, out=_NO_OUT) -> Tuple:
+    # children swap the genes in [p, q); their loads and values change only by that segment
+    sa, sb = a[p:q], b[p:q]
+    problem, values = ga.problem, ga._values
+    la, lb = problem.loads(sa, p), problem.loads(sb, p)
+    segment = values[p:q]
+    va, vb = sum(compress(segment, sa)), sum(compress(segment, sb))
+    loads1 = [x - y + z for x, y, z in zip(a.loads, la, lb)]
+    loads2 = [x - z + y for x, y, z in zip(b.loads, la, lb)]
+    genome, dims = type(a), ga._dims
+    return (
+        _made(genome, _splice(a, b, p, q, out[0]), sum(loads1[::dims]), a.value - va + vb, loads1),
+        _made(genome, _splice(b, a, p, q, out[1]), sum(loads2[::dims]), b.value - vb + va, loads2),
+    )
+
+
+def _assign(ga, individual, i: int, gene: int) -> None:
+    # move item i to knapsack `gene` (0 = out), updating loads, weight and value in O(dimensions)
+    old = individual[i]
+    if old == gene:
+        return
+    row, dims, loads = ga.problem.item_weights[i], ga._dims, individual.loads
+    if old:
+        base = (old - 1) * dims
+        for k, w in enumerate(row):
+            loads[base + k] -= w
+        individual.weight -= row[0]
+        individual.value -= ga._values[i]
+    if gene:
+        base = (gene - 1) * dims
+        for k, w in enumerate(row):
+            loads[base + k] += w
+        individual.weight += row[0]
+        individual.value += ga._values[i]
+    individual[i] = gene
+
+
+# --- selection: (ga, population, fitnesses) -> parent ---
+
+def tournament(ga, population: List, fitnesses: List[float]):
+    best = random.randrange(len(population))
+    for _ in range(ga.tournament_size - 1):
+        challenger = random.randrange(len(population))
+        if fitnesses[challenger] > fitnesses[best]:
+            best = challenger
+    return population[best]
+
+
+def _ranked(ga, fitnesses: List[float]) -> List[int]:
+    # indices from worst to best, sorted once per generation (each generation builds a new fitness list)
+    cached = ga._selection_cache
+    if cached is None or cached[0] is not fitnesses:
+        cached = ga._selection_cache = (fitnesses, sorted(range(len(fitnesses)), key=fitnesses.__getitem__))
+    return cached[1]
+
+
+def rank(ga, population: List, fitnesses: List[float]):
+    """Ranking linear: o k-ésimo pior tem peso k, independentemente da escala do fitness."""
+    order = _ranked(ga, fitnesses)
+    n = len(order)
+    # invert the triangular cumulative weight k(k+1)/2 instead of bisecting
+    r = random.random() * n * (n + 1) / 2
+    k = int((math.sqrt(8 * r + 1) - 1) / 2)
+    return population[order[min(k, n - 1)]]
+
+
+def truncation(ga, population: List, fitnesses: List[float]):
+    """Sorteio uniforme entre os TRUNCATION_FRACTION melhores."""
+    order = _ranked(ga, fitnesses)
+    cut = max(1, int(len(order) * TRUNCATION_FRACTION))
+    return population[order[-1 - random.randrange(cut)]]
+
+
+# --- crossover: (ga, a, b, out=(None, None)) -> (child1, child2, crossed) ---
+
+def one_point(ga, a, b, out=_NO_OUT) -> Tuple:
+    n = len(ga.problem)
+    if random.random() > ga.crossover_rate or n < 2:
+        return _copied(a, out[0]), _copied(b, out[1]), False
+    point = random.randrange(1, n)
+    if ga._multi:
+        # exchange whichever side of the cut is shorter
+        if 2 * point <= n:
+            c2, c1 = _exchange(ga, a, b, 0, point, out[::-1])
+            return c1, c2, True
+        return (*_exchange(ga, a, b, point, n, out), True)
+    if _is_bits(ga):
+        low = (1 << point) - 1
+        return (
+            ga._bit_genome((a.bits & low) | (b.bits & ~low), out[0]),
+            ga._bit_genome((b.bits & low) | (a.bits & ~low), out[1]),
+            True,
+        )
+    (aw, av), (bw, bv) = ga._prefix(a), ga._prefix(b)
+    genome = type(a)
+    c1 = _made(genome, _splice(a, b, point, n, out[0]), aw[point] + b.weight - bw[point], av[point] + b.value - bv[point])
+    c2 = _made(genome, _splice(b, a, point, n, out[1]), bw[point] + a.weight - aw[point], bv[point] + a.value - av[point])
+    return c1, c2, True
+
+
+def two_point(ga, a, b, out=_NO_OUT) -> Tuple:
+    """Troca o trecho entre dois cortes; pesos e valores dos filhos vêm das somas de prefixo dos pais."""
+    n = len(ga.problem)
+    if random.random() > ga.crossover_rate or n < 3:
+        return _copied(a, out[0]), _copied(b, out[1]), False
+    p, q = sorted(random.sample(range(1, n), 2))
+    if ga._multi:
+        return (*_exchange(ga, a, b, p, q, out), True)
+    if _is_bits(ga):
+        mid = ((1 << q) - 1) ^ ((1 << p) - 1)
+        return (
+            ga._bit_genome((a.bits & ~mid) | (b.bits & mid), out[0]),
+            ga._bit_genome((b.bits & ~mid) | (a.bits & mid), out[1]),
+            True,
+        )
+    (aw, av), (bw, bv) = ga._prefix(a), ga._prefix(b)
+    dw, dv = (bw[q] - bw[p]) - (aw[q] - aw[p]), (bv[q] - bv[p]) - (av[q] - av[p])
+    genome = type(a)
+    c1 = _made(genome, _splice(a, b, p, q, out[0]), a.weight + dw, a.value + dv)
+    c2 = _made(genome, _splice(b, a, p, q, out[1]), b.weight - dw, b.value - dv)
+    return c1, c2, True
+
+
+def _mask_children(ga, a, b, mask: int, out=_NO_OUT) -> Tuple:
+    # child 1 takes a's gene where the mask bit is set and b's elsewhere; child 2 the complement
+    if _is_bits(ga):
+        return (
+            ga._bit_genome((a.bits & mask) | (b.bits & ~mask), out[0]),
+            ga._bit_genome((b.bits & mask) | (a.bits & ~mask), out[1]),
+        )
+    # list genomes: one byte per gene packed into big ints, so the merge runs in C instead of a per-gene loop
+    n = len(a)
+    m = int.from_bytes(b"".join(_SPREAD[byte] for byte in mask.to_bytes((n + 7) // 8, "little"))[:n], "little")
+    rest = int.from_bytes(b"\x01" * n, "little") ^ m
+    if ga._multi:
+        # genes go up to the number of knapsacks: widen the 0/1 byte masks to 0x00/0xff
+        m, rest = m * 255, rest * 255
+    x, y = int.from_bytes(bytes(a), "little"), int.from_bytes(bytes(b), "little")
+    g1 = _filled(((x & m) | (y & rest)).to_bytes(n, "little"), out[0])
+    g2 = _filled(((y & m) | (x & rest)).to_bytes(n, "little"), out[1])
+    if ga._multi:
+        return _multi_children(ga, a, b, g1, g2)
+    # together the children hold exactly the parents' genes, so child 2's totals follow from child 1's
+    w1, v1 = sum(compress(ga._weights, g1)), sum(compress(ga._values, g1))
+    genome = type(a)
+    return _made(genome, g1, w1, v1), _made(genome, g2, a.weight + b.weight - w1, a.value + b.value - v1)
+
+
+def uniform(ga, a, b, out=_NO_OUT) -> Tuple:
+    """Cada gene vem de um dos pais com probabilidade 1/2 (máscara aleatória de n bits)."""
+    n = len(ga.problem)
+    if random.random() > ga.crossover_rate or n < 2:
+        return _copied(a, out[0]), _copied(b, out[1]), False
+    return (*_mask_children(ga, a, b, random.getrandbits(n), out), True)
+
+
+def mask(ga, a, b, out=_NO_OUT) -> Tuple:
+    """Uniforme enviesado: o primeiro filho herda cada gene do pai mais apto com probabilidade 3/4."""
+    n = len(ga.problem)
+    if random.random() > ga.crossover_rate or n < 2:
+        return _copied(a, out[0]), _copied(b, out[1]), False
+    if b.value > a.value:
+        a, b = b, a
+    # OR of two uniform masks sets each bit with probability 3/4
+    return (*_mask_children(ga, a, b, random.getrandbits(n) | random.getrandbits(n), out), True)
+
+
+# --- mutation: (ga, individual) -> number of flipped genes (in place) ---
+
+def _flip_bits(ga, individual, positions) -> int:
+    flip_mask = 0
+    for i in positions:
+        flip_mask |= 1 << i
+    if not flip_mask:
+        return 0
+    flipped = ga._bit_genome(individual.bits ^ flip_mask)
+    individual.bits, individual.weight, individual.value = flipped.bits, flipped.weight, flipped.value
+    return flip_mask.bit_count()
+
+
+def _flip_genes(ga, individual, positions) -> int:
+    weights, values = ga._weights, ga._values
+    flips = 0
+    for i in positions:
+        if individual[i]:
+            individual[i] = 0
+            individual.weight -= weights[i]
+            individual.value -= values[i]
+        else:
+            individual[i] = 1
+            individual.weight += weights[i]
+            individual.value += values[i]
+        flips += 1
+    if flips:
+        individual._prefix = None
+    return flips
+
+
+def _reassign_genes(ga, individual, positions) -> int:
+    # multi-knapsack "flip": move the item to another knapsack or out, uniformly among the other options
+    k = ga._bins
+    changed = 0
+    for i in positions:
+        _assign(ga, individual, i, (individual[i] + random.randint(1, k)) % (k + 1))
+        changed += 1
+    return changed
+
+
+def flip(ga, individual) -> int:
+    """Cada gene é invertido com probabilidade mutation_rate (um sorteio por gene na lista)."""
+    if ga._multi:
+        rate = ga.mutation_rate
+        return _reassign_genes(ga, individual, [i for i in range(len(individual)) if random.random() < rate])
+    if _is_bits(ga):
+        return _flip_bits(ga, individual, ga._flip_positions(len(ga.problem)))
+    rate = ga.mutation_rate
+    return _flip_genes(ga, individual, [i for i in range(len(individual)) if random.random() < rate])
+
+
+def geometric(ga, individual) -> int:
+    """Mesma distribuição de flip, mas sorteia só as posições invertidas (saltos geométricos)."""
+    positions = ga._flip_positions(len(ga.problem))
+    if ga._multi:
+        return _reassign_genes(ga, individual, positions)
+    if _is_bits(ga):
+        return _flip_bits(ga, individual, positions)
+    return _flip_genes(ga, individual, positions)
+
+
+def swap(ga, individual) -> int:
+    """Troca itens selecionados por não selecionados: o nº de itens na mochila não muda."""
+    n = len(ga.problem)
+    if ga._multi:
+        gene = individual.__getitem__
+
+        def exchange(i: int, j: int) -> None:
+            gi, gj = individual[i], individual[j]
+            _assign(ga, individual, i, gj)
+            _assign(ga, individual, j, gi)
+    elif _is_bits(ga):
+        # bit tests and edits on a bytearray are O(1), unlike shifting the big int
+        buf = bytearray(individual.bits.to_bytes(ga._nbytes, "little"))
+        gene = lambda k: buf[k >> 3] >> (k & 7) & 1
+
+        def exchange(i: int, j: int) -> None:
+            buf[i >> 3] ^= 1 << (i & 7)
+            buf[j >> 3] ^= 1 << (j & 7)
+    else:
+        weights, values = ga._weights, ga._values
+        gene = individual.__getitem__
+
+        def exchange(i: int, j: int) -> None:
+            added, removed = (j, i) if individual[i] else (i, j)
+            individual[added], individual[removed] = 1, 0
+            individual.weight += weights[added] - weights[removed]
+            individual.value += values[added] - values[removed]
+
+    swaps = 0
+    for i in ga._flip_positions(n):
+        # partner with the opposite gene, found by rejection sampling
+        for _ in range(8):
+            j = random.randrange(n)
+            if gene(j) != gene(i):
+                exchange(i, j)
+                swaps += 1
+                break
+    if swaps and _is_bits(ga):
+        swapped = ga._bit_genome(int.from_bytes(buf, "little"))
+        individual.bits, individual.weight, individual.value = swapped.bits, swapped.weight, swapped.value
+    elif swaps:
+        individual._prefix = None
+    return 2 * swaps
+
+
+# --- repair: (ga, individual) -> None (in place) ---
+
+def ratio(ga, individual) -> None:
+    """Remove itens da pior para a melhor razão valor/peso até caber; com repair_fill, completa gulosamente."""
+    if ga._multi:
+        _ratio_multi(ga, individual)
+        return
+    if _is_bits(ga):
+        _ratio_bits(ga, individual)
+        return
+    weights, values = ga._weights, ga._values
+    capacity = ga.problem.capacity
+    order = ga.problem.ratio_order
+    steps = 0
+    changed = False
+
+    if individual.weight > capacity:
+        # drop selected items from the worst value/weight ratio up until it fits
+        for i in reversed(order):
+            steps += 1
+            if individual[i]:
+                individual[i] = 0
+                individual.weight -= weights[i]
+                individual.value -= values[i]
+                changed = True
+                if individual.weight <= capacity:
+                    break
+
+    if ga.repair_fill:
+        # greedily add the best unselected items that still fit
+        for i in order:
+            if capacity - individual.weight < ga._min_weight:
+                break
+            steps += 1
+            if not individual[i] and individual.weight + weights[i] <= capacity:
+                individual[i] = 1
+                individual.weight += weights[i]
+                individual.value += values[i]
+                changed = True
+
+    if changed:
+        individual._prefix = None
+    ga.repair_steps += steps
+
+
+def _ratio_bits(ga, individual) -> None:
+    weights, values = ga._weights, ga._values
+    capacity = ga.problem.capacity
+    order = ga.problem.ratio_order
+    fill = ga.repair_fill and capacity - individual.weight >= ga._min_weight
+    if individual.weight <= capacity and not fill:
+        return
+    # bit tests and edits on a bytearray are O(1), unlike shifting the big int
+    buf = bytearray(individual.bits.to_bytes(ga._nbytes, "little"))
+    steps = 0
+
+    if individual.weight > capacity:
+        for i in reversed(order):
+            steps += 1
+            bit = 1 << (i & 7)
+            if buf[i >> 3] & bit:
+                buf[i >> 3] ^= bit
+                individual.weight -= weights[i]
+                individual.value -= values[i]
+                if individual.weight <= capacity:
+                    break
+
+    if ga.repair_fill:
+        for i in order:
+            if capacity - individual.weight < ga._min_weight:
+                break
+            steps += 1
+            bit = 1 << (i & 7)
+            if not buf[i >> 3] & bit and individual.weight + weights[i] <= capacity:
+                buf[i >> 3] |= bit
+                individual.weight += weights[i]
+                individual.value += values[i]
+
+    individual.bits = int.from_bytes(buf, "little")
+    ga.repair_steps += steps
+
+
+def _ratio_multi(ga, individual) -> None:
+    # same walk over ratio_order, removing items only from overloaded knapsacks; fill uses first fit
+    problem = ga.problem
+    order = problem.ratio_order
+    dims, loads, caps = ga._dims, individual.loads, problem._flat_capacities
+    over = lambda b: any(loads[b * dims + k] > caps[b * dims + k] for k in range(dims))
+    overloaded = {b for b in range(ga._bins) if over(b)}
+    steps = 0
+
+    if overloaded:
+        for i in reversed(order):
+            steps += 1
+            b = individual[i] - 1
+            if b in overloaded:
+                _assign(ga, individual, i, 0)
+                if not over(b):
+                    overloaded.discard(b)
+                    if not overloaded:
+                        break
+
+    if ga.repair_fill:
+        for i in order:
+            steps += 1
+            if not individual[i]:
+                for b in range(ga._bins):
+                    if problem.fits(loads, i, b):
+                        _assign(ga, individual, i, b + 1)
+                        break
+
+    ga.repair_steps += steps
+
+
+def none(ga, individual) -> None:
+    """Sem reparo: indivíduos inviáveis ficam na população com a penalidade do problema."""
+
+
+SELECTIONS: Dict[str, Callable] = {"tournament": tournament, "rank": rank, "truncation": truncation}
+CROSSOVERS: Dict[str, Callable] = {"one_point": one_point, "two_point": two_point, "uniform": uniform, "mask": mask}
+MUTATIONS: Dict[str, Callable] = {"flip": flip, "geometric": geometric, "swap": swap}
+REPAIRS: Dict[str, Callable] = {"ratio": ratio, "none": none}
+
+
+def bind(ga, strategy: Union[str, Callable], registry: Dict[str, Callable], kind: str):
+    """Resolve o nome (ou aceita uma função própria) e o liga ao AG como método."""
+    if callable(strategy):
+        func = strategy
+    else:
+        func = registry.get(strategy)
+        if func is None:
+            raise ValueError(f"Estratégia de {kind} inválida: {strategy}. Use uma de {', '.join(registry)}.")
+    return MethodType(func, ga)
@@ -0,0 +1,71 @@
+import json
+import os
+import time
+from functools import wraps
+from typing import Dict, List
+
+# phase name -> GeneticAlgorithm method that implements it
+PHASES = {
+    'selection': '_select',
+    'crossover': '_crossover',
+    'mutation': '_mutate',
+    'repair': '_repair',
+    'evaluation': 'evaluate',
+}
+
+
+class PhaseProfiler:
+    """Acumula tempo (perf_counter_ns) e nº de chamadas por operador do AG, por geração.
+
+    Só é instalado quando pedido: os métodos do AG são substituídos por versões cronometradas na
+    instância, de modo que um AG sem profiler executa exatamente o código original, sem custo extra.
+    """
+
+    def __init__(self, trace: bool = False, max_events: int = 200_000) -> None:
+        self.trace = trace
+        self.max_events = int(max_events)
+        self.events: List[dict] = []
+        self._ns: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self._calls: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self._origin = time.perf_counter_ns()
+        self._gen_start = self._origin
+
+    def attach(self, ga) -> None:
+        for phase, attr in PHASES.items():
+            setattr(ga, attr, self._wrap(phase, getattr(ga, attr)))
+
+    def _wrap(self, phase: str, func):
+        ns, calls, clock = self._ns, self._calls, time.perf_counter_ns
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            t0 = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                t1 = clock()
+                ns[phase] += t1 - t0
+                calls[phase] += 1
+                if self.trace and len(self.events) < self.max_events:
+                    self.events.append({'name': phase, 'ph': 'X', 'ts': (t0 - self._origin) / 1000, 'dur': (t1 - t0) / 1000, 'pid': os.getpid(), 'tid': 0})
+
+        return timed
+
+    def end_generation(self, gen: int) -> dict:
+        """Devolve os totais da geração (`time_<fase>` em segundos, `calls_<fase>`) e zera os acumuladores."""
+        stats = {}
+        for phase in PHASES:
+            stats[f'time_{phase}'] = self._ns[phase] / 1e9
+            stats[f'calls_{phase}'] = self._calls[phase]
+            self._ns[phase] = 0
+            self._calls[phase] = 0
+        now = time.perf_counter_ns()
+        if self.trace and len(self.events) < self.max_events:
+            self.events.append({'name': f'geração {gen}', 'ph': 'X', 'ts': (self._gen_start - self._origin) / 1000, 'dur': (now - self._gen_start) / 1000, 'pid': os.getpid(), 'tid': 1})
+        self._gen_start = now
+        return stats
+
+    def export_chrome_trace(self, path: str) -> None:
+        """Grava a linha do tempo no formato Chrome trace (abrir em chrome://tracing ou Perfetto)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
@@ -0,0 +1,122 @@
+import os
+import pickle
+import time
+import zlib
+from typing import List, Optional, Sequence
+
+from problem.problem import KnapsackProblem
+
+_WARM_MAGIC = b"KGAWARM1"
+
+
+def item_keys(problem: KnapsackProblem) -> List[str]:
+    """Chave de cada item para o mapeamento entre execuções: o nome, ou a posição para itens sem nome."""
+    names = problem.names or [None] * len(problem)
+    return [name if name is not None else f"#{i}" for i, name in enumerate(names)]
+
+
+def has_names(problem: KnapsackProblem) -> bool:
+    """Todos os itens têm nome: só então as chaves identificam itens entre instâncias diferentes."""
+    return problem.names is not None and all(name is not None for name in problem.names)
+
+
+def map_genomes(keys: Sequence[str], genomes: Sequence[bytes], problem: KnapsackProblem) -> List[List[int]]:
+    """Leva genomas gravados para o conjunto de itens atual; itens novos começam fora da mochila."""
+    position = {}
+    for i, key in enumerate(item_keys(problem)):
+        position.setdefault(key, i)
+    # (old index, new index) of the items present in both instances
+    pairs = [(j, position[key]) for j, key in enumerate(keys) if key in position]
+    bins = problem.bins
+    mapped = []
+    for genome in genomes:
+        genes = [0] * len(problem)
+        for j, i in pairs:
+            # a knapsack that no longer exists means "out"
+            genes[i] = genome[j] if genome[j] <= bins else 0
+        mapped.append(genes)
+    return mapped
+
+
+class WarmStartStore:
+    """Populações finais gravadas por impressão digital da instância, para semear a próxima execução.
+
+    A busca tenta a mesma instância e, se não houver e todos os itens tiverem nome, a entrada nomeada com
+    mais itens em comum. Chaves posicionais (`#i`) não dizem nada sobre outra instância, então instâncias
+    sem nomes só aproveitam uma entrada de impressão digital idêntica.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 32, min_overlap: float = 0.5) -> None:
+        self.directory = directory
+        self.max_entries = int(max_entries)
+        self.min_overlap = float(min_overlap)
+
+    def _path(self, fingerprint: str) -> str:
+        return os.path.join(self.directory, f"{fingerprint[:32]}.warm")
+
+    def _read(self, path: str) -> Optional[dict]:
+        try:
+            with open(path, "rb") as f:
+                payload = f.read()
+            if not payload.startswith(_WARM_MAGIC):
+                return None
+            return pickle.loads(zlib.decompress(payload[len(_WARM_MAGIC):]))
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError, zlib.error):
+            return None
+
+    def _entries(self) -> List[str]:
+        try:
+            files = [os.path.join(self.directory, f) for f in os.listdir(self.directory) if f.endswith(".warm")]
+        except OSError:
+            return []
+        return sorted(files, key=os.path.getmtime, reverse=True)
+
+    def save(self, problem: KnapsackProblem, population: Sequence[Sequence[int]], best: Sequence[int], best_value: int) -> str:
+        """Grava população e melhor solução (genomas completos) de forma atômica e descarta as entradas mais antigas."""
+        os.makedirs(self.directory, exist_ok=True)
+        fingerprint = problem.fingerprint()
+        entry = {
+            "fingerprint": fingerprint,
+            "keys": item_keys(problem),
+            "named": has_names(problem),
+            "best": bytes(best),
+            "best_value": best_value,
+            "population": [bytes(genes) for genes in population],
+            "saved": time.time(),
+        }
+        path = self._path(fingerprint)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_WARM_MAGIC + zlib.compress(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)))
+        os.replace(tmp, path)
+        for old in self._entries()[self.max_entries:]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+        return path
+
+    def load(self, problem: KnapsackProblem) -> Optional[dict]:
+        """Entrada mais parecida com a instância (mesma impressão digital, ou mais itens em comum por nome), ou None."""
+        exact = self._read(self._path(problem.fingerprint()))
+        if exact is not None and exact["fingerprint"] == problem.fingerprint():
+            exact["overlap"] = 1.0
+            return exact
+        if not has_names(problem):
+            return None
+        keys = set(item_keys(problem))
+        best, best_overlap = None, self.min_overlap
+        for path in self._entries():
+            entry = self._read(path)
+            if entry is None or not entry.get("named"):
+                continue
+            overlap = len(keys.intersection(entry["keys"])) / max(1, len(keys), len(entry["keys"]))
+            if overlap >= best_overlap:
+                best, best_overlap = entry, overlap
+        if best is not None:
+            best["overlap"] = best_overlap
+        return best
+
+    def genomes(self, entry: dict, problem: KnapsackProblem) -> List[List[int]]:
+        """Melhor solução seguida da população gravada, mapeadas para os itens de `problem`."""
+        return map_genomes(entry["keys"], [entry["best"], *entry["population"]], problem)
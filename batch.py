@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Resolve em lote todos os JSONs de uma pasta, gravando um registro por instância (JSONL ou CSV)."""
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+ROOT = os.path.abspath(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from problem.problem import KnapsackProblem
+from algorithms.ga import GeneticAlgorithm
+from algorithms.exact import SOLVERS, BranchAndBoundSolver, DynamicProgrammingSolver, choose_solver
+from json_utils import list_json_files, load_instance
+from main import choose_parameters
+
+FIELDS = ['instance', 'status', 'solver', 'n_items', 'capacity', 'best_value', 'best_weight', 'generations', 'elapsed', 'error']
+
+
+def solve_instance(path: str, params: dict) -> dict:
+    """Executa o AG numa instância e devolve o registro de resultado (nunca levanta exceção)."""
+    record = {'instance': os.path.basename(path), 'status': 'ok', 'error': ''}
+    try:
+        instance = load_instance(path)
+        capacity = instance.capacity or params.get('capacity')
+        if capacity is None:
+            raise ValueError("instância sem 'capacity' e --capacity não informado")
+        # names are only needed for display, so the batch never reads them
+        problem = KnapsackProblem.from_arrays(instance.weights, instance.values, capacity,
+                                              extra_weights=instance.extra_weights, knapsacks=instance.knapsacks)
+
+        solver = params.get('solver', 'ga')
+        if solver == 'auto':
+            solver = choose_solver(problem, params.get('max_time'))
+
+        start = time.perf_counter()
+        # like main.py and server.py: exact solvers fall back to the GA on multi problems or when out of time
+        exact_result = None
+        if solver != 'ga' and problem.multi:
+            solver = 'ga'
+        if solver != 'ga':
+            try:
+                exact = (DynamicProgrammingSolver if solver == 'dp' else BranchAndBoundSolver)(problem)
+                exact_result = exact.solve(max_time=params.get('max_time'))
+            except TimeoutError:
+                solver = 'ga'
+        if exact_result is not None:
+            _, total_value, total_weight = exact_result
+            generations_run = 0
+        else:
+            if params.get('auto'):
+                pop_size, generations, mutation_rate = choose_parameters(problem.items, capacity)
+            else:
+                pop_size, generations, mutation_rate = params['pop_size'], params['generations'], params['mutation_rate']
+            ga = GeneticAlgorithm(problem, pop_size=pop_size, generations=generations, mutation_rate=mutation_rate)
+            _, total_value, total_weight = ga.evolve(max_time=params.get('max_time'), stable_limit=params.get('stable_limit'))
+            generations_run = ga.generations_run
+        record.update(
+            solver=solver,
+            n_items=len(problem),
+            capacity=capacity,
+            best_value=total_value,
+            best_weight=total_weight,
+            generations=generations_run,
+            elapsed=round(time.perf_counter() - start, 6),
+        )
+    except Exception as exc:
+        record.update(status='error', error=str(exc))
+    return record
+
+
+def read_done(output: str) -> set:
+    """Instâncias já resolvidas com sucesso no arquivo de saída (para retomar após reinício).
+
+    Registros com erro não contam: a instância é tentada de novo, já que a falha pode ter sido passageira.
+    """
+    done: set = set()
+    if not os.path.exists(output):
+        return done
+    with open(output, 'r', encoding='utf-8', newline='') as f:
+        if output.endswith('.csv'):
+            done.update(row['instance'] for row in csv.DictReader(f) if row.get('instance') and row.get('status') == 'ok')
+        else:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    if record.get('status') == 'ok':
+                        done.add(record['instance'])
+                except (ValueError, KeyError, AttributeError):
+                    continue
+    return done
+
+
+class ResultWriter:
+    """Grava registros incrementalmente (um por linha), com flush a cada instância."""
+
+    def __init__(self, output: str) -> None:
+        self.is_csv = output.endswith('.csv')
+        new_file = not os.path.exists(output) or os.path.getsize(output) == 0
+        self._f = open(output, 'a', encoding='utf-8', newline='')
+        self._csv = csv.DictWriter(self._f, fieldnames=FIELDS, extrasaction='ignore') if self.is_csv else None
+        if self._csv is not None and new_file:
+            self._csv.writeheader()
+
+    def write(self, record: dict) -> None:
+        if self._csv is not None:
+            self._csv.writerow(record)
+        else:
+            self._f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+
+def run_batch(directory: str, output: str, params: dict, workers: Optional[int] = None) -> int:
+    files = list_json_files(directory)
+    done = read_done(output)
+    pending = [name for name in files if name not in done]
+    print(f'{len(files)} instâncias encontradas, {len(files) - len(pending)} já resolvidas, {len(pending)} pendentes')
+    if not pending:
+        return 0
+
+    writer = ResultWriter(output)
+    failures = 0
+    count = 0
+
+    def report(record: dict) -> None:
+        nonlocal failures, count
+        count += 1
+        writer.write(record)
+        failures += record['status'] != 'ok'
+        detail = f"valor={record['best_value']} peso={record['best_weight']} t={record['elapsed']:.2f}s" if record['status'] == 'ok' else record['error']
+        print(f"[{count}/{len(pending)}] {record['instance']}: {detail}")
+
+    def failed(name: str, error: str) -> dict:
+        return {'instance': name, 'status': 'error', 'error': error}
+
+    max_workers = workers or os.cpu_count() or 1
+    queue = deque(pending)
+    try:
+        while queue:
+            # at most max_workers instances in flight: if a worker dies, only those are suspects
+            suspects = []
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                in_flight = {}
+                while queue or in_flight:
+                    while queue and len(in_flight) < max_workers:
+                        name = queue.popleft()
+                        in_flight[pool.submit(solve_instance, os.path.join(directory, name), params)] = name
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        name = in_flight.pop(fut)
+                        try:
+                            report(fut.result())
+                        except BrokenProcessPool:
+                            suspects.append(name)
+                        except Exception as exc:
+                            report(failed(name, str(exc)))
+                    if suspects:
+                        # the pool is unusable: every instance still in flight failed with it
+                        suspects.extend(in_flight.values())
+                        break
+            # each suspect runs alone in a fresh pool, so a crash is attributed to the right instance
+            for name in suspects:
+                with ProcessPoolExecutor(max_workers=1) as solo:
+                    try:
+                        report(solo.submit(solve_instance, os.path.join(directory, name), params).result())
+                    except BrokenProcessPool:
+                        report(failed(name, 'o processo do worker terminou inesperadamente'))
+                    except Exception as exc:
+                        report(failed(name, str(exc)))
+    finally:
+        writer.close()
+    return failures
+
+
+def main(argv: list[str]) -> int:
+    import argparse
+    p = argparse.ArgumentParser(description='Resolve em lote todas as instâncias JSON de uma pasta.')
+    p.add_argument('--dir', required=True, help='pasta com os arquivos JSON')
+    p.add_argument('--output', required=True, help='arquivo de resultados (.jsonl ou .csv); instâncias já presentes são puladas')
+    p.add_argument('--workers', type=int, default=None, help='número máximo de instâncias resolvidas em paralelo (padrão: nº de CPUs)')
+    p.add_argument('--auto', action='store_true', help='seleciona parâmetros do AG automaticamente por instância')
+    p.add_argument('--pop-size', type=int, default=80, help='tamanho da população')
+    p.add_argument('--generations', type=int, default=150, help='número de gerações')
+    p.add_argument('--mutation-rate', type=float, default=0.02, help='taxa de mutação por gene')
+    p.add_argument('--max-time', type=float, default=5.0, help='tempo máximo por instância em segundos (padrão: 5)')
+    p.add_argument('--stable-limit', type=int, default=15, help='gerações sem melhora para parar (0 desativa)')
+    p.add_argument('--capacity', type=int, default=None, help='capacidade a usar nas instâncias sem "capacity"')
+    p.add_argument('--solver', choices=SOLVERS, default='ga', help='método por instância; auto escolhe entre dp, bnb e ga pelo custo estimado')
+    args = p.parse_args(argv)
+
+    if not os.path.isdir(args.dir):
+        print('Pasta não encontrada:', args.dir)
+        return 1
+
+    params = {
+        'auto': args.auto,
+        'pop_size': args.pop_size,
+        'generations': args.generations,
+        'mutation_rate': args.mutation_rate,
+        'max_time': args.max_time,
+        'stable_limit': args.stable_limit,
+        'capacity': args.capacity,
+        'solver': args.solver,
+    }
+    failures = run_batch(args.dir, args.output, params, workers=args.workers)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
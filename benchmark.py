@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Benchmark do AG em instâncias sintéticas, com comparação contra um baseline salvo."""
+import json
+import os
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+ROOT = os.path.abspath(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from problem.generators import KINDS, generate_instance
+from problem.problem import KnapsackProblem
+from algorithms.ga import GeneticAlgorithm, REPLACEMENTS, REPRESENTATIONS
+from algorithms.operators import CROSSOVERS, MUTATIONS, REPAIRS, SELECTIONS
+from algorithms.exact import DynamicProgrammingSolver
+
+# exact optimum only when the DP table stays small enough to be quick
+EXACT_LIMIT = 20_000_000
+STRATEGIES = {'selection': SELECTIONS, 'crossover': CROSSOVERS, 'mutation': MUTATIONS, 'repair': REPAIRS}
+PHASE_NAMES = {'selection': 'seleção', 'crossover': 'crossover', 'mutation': 'mutação', 'repair': 'reparo'}
+DEFAULT_STRATEGIES = {'selection': 'tournament', 'crossover': 'one_point', 'mutation': 'flip', 'repair': 'ratio'}
+
+
+def exact_optimum(problem: KnapsackProblem) -> Optional[int]:
+    if len(problem) * problem.capacity > EXACT_LIMIT:
+        return None
+    return DynamicProgrammingSolver(problem).solve()[1]
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(kind: str, n: int, seed: int, params: dict) -> dict:
+    """Mede um caso (classe × tamanho). Executado em processo próprio para que o pico de RSS seja do caso."""
+    problem = generate_instance(n, kind, seed=seed)
+
+    rng = random.Random(seed)
+    genomes = [[rng.randint(0, 1) for _ in range(n)] for _ in range(20)]
+    evals = 0
+    start = time.perf_counter()
+    while True:
+        for g in genomes:
+            problem.evaluate(g)
+        evals += len(genomes)
+        eval_time = time.perf_counter() - start
+        if eval_time >= params['eval_time']:
+            break
+
+    random.seed(seed)
+    ga = GeneticAlgorithm(
+        problem,
+        pop_size=params['pop_size'],
+        generations=params['generations'],
+        mutation_rate=params['mutation_rate'] or min(0.1, max(1.0 / n, 1e-6)),
+        representation=params['representation'],
+        replacement=params['replacement'],
+        replace_count=params['replace_count'],
+        **params['strategies'],
+    )
+    start = time.perf_counter()
+    _, best_value, best_weight = ga.evolve(max_time=params['max_time'], stable_limit=None)
+    elapsed = time.perf_counter() - start
+    # steady_state evaluates only the replaced individuals after the first generation
+    per_gen = ga.replace_count if ga.replacement == 'steady_state' else ga.pop_size
+    ga_evaluations = ga.pop_size + max(0, ga.generations_run - 1) * per_gen if ga.generations_run else 0
+
+    optimum = exact_optimum(problem) if params['exact'] else None
+    custom = [name for phase, name in params['strategies'].items() if name != DEFAULT_STRATEGIES[phase]]
+    if params['replacement'] != 'generational':
+        custom.append(params['replacement'])
+    return {
+        'case': '-'.join([kind, str(n)] + custom),
+        'kind': kind,
+        'n': n,
+        'seed': seed,
+        'capacity': problem.capacity,
+        'generations': ga.generations_run,
+        'elapsed': round(elapsed, 6),
+        'generations_per_sec': round(ga.generations_run / elapsed, 3) if elapsed > 0 else 0.0,
+        'evaluations_per_sec': round(evals / eval_time, 3),
+        'ga_evaluations_per_sec': round(ga_evaluations / elapsed, 3) if elapsed > 0 else 0.0,
+        'best_value': best_value,
+        'best_weight': best_weight,
+        'optimum': optimum,
+        'quality': round(best_value / optimum, 6) if optimum else None,
+        'peak_rss_mb': round(_peak_rss_mb(), 2),
+    }
+
+
+def run_operators(kind: str, n: int, seed: int, params: dict) -> List[dict]:
+    """Mede cada estratégia de algorithms/operators.py isoladamente (chamadas/s) sobre a população inicial da instância."""
+    problem = generate_instance(n, kind, seed=seed)
+    records = []
+    for phase, registry in STRATEGIES.items():
+        for name in registry:
+            random.seed(seed)
+            ga = GeneticAlgorithm(
+                problem,
+                pop_size=params['pop_size'],
+                mutation_rate=params['mutation_rate'] or min(0.1, max(1.0 / n, 1e-6)),
+                representation=params['representation'],
+                **{phase: name},
+            )
+            population = ga.initialize_population()
+            fitnesses = [ga.fitness(ind) for ind in population]
+            pairs = [(random.choice(population), random.choice(population)) for _ in range(64)]
+            if phase == 'selection':
+                call = lambda k: ga._select(population, fitnesses)
+            elif phase == 'crossover':
+                call = lambda k: ga._crossover(*pairs[k % 64])
+            elif phase == 'mutation':
+                work = [ind.clone() for ind in population]
+                call = lambda k: ga._mutate(work[k % len(work)])
+            else:
+                # repair needs fresh, usually overweight offspring; the clone is part of every measurement
+                offspring = []
+                for a, b in pairs:
+                    child = ga._crossover(a, b)[0]
+                    ga._mutate(child)
+                    offspring.append(child)
+                call = lambda k: ga._repair(offspring[k % 64].clone())
+
+            calls = 0
+            start = time.perf_counter()
+            while True:
+                for k in range(calls, calls + 64):
+                    call(k)
+                calls += 64
+                elapsed = time.perf_counter() - start
+                if elapsed >= params['eval_time']:
+                    break
+            records.append({
+                'case': f'{kind}-{n}-{phase}-{name}',
+                'kind': kind,
+                'n': n,
+                'phase': phase,
+                'strategy': name,
+                'calls_per_sec': round(calls / elapsed, 3),
+            })
+    return records
+
+
+def compare(results: List[dict], baseline: List[dict], tolerance: float) -> List[str]:
+    """Lista de regressões: throughput ou qualidade abaixo de (1 - tolerance) × baseline."""
+    by_case = {rec['case']: rec for rec in baseline}
+    problems = []
+    for rec in results:
+        base = by_case.get(rec['case'])
+        if base is None:
+            continue
+        for key in ('generations_per_sec', 'evaluations_per_sec', 'quality', 'calls_per_sec'):
+            old, new = base.get(key), rec.get(key)
+            if old and new is not None and new < old * (1 - tolerance):
+                problems.append(f"{rec['case']}: {key} {new} < {old} (baseline)")
+    return problems
+
+
+def main(argv: list[str]) -> int:
+    import argparse
+    p = argparse.ArgumentParser(description='Benchmark do AG em instâncias sintéticas.')
+    p.add_argument('--sizes', default='10,100,1000,10000', help='tamanhos separados por vírgula (ex.: 10,1000,1000000)')
+    p.add_argument('--kinds', default=','.join(KINDS), help=f"classes separadas por vírgula ({', '.join(KINDS)})")
+    p.add_argument('--seed', type=int, default=12345, help='semente do gerador e do AG')
+    p.add_argument('--pop-size', type=int, default=100, help='tamanho da população')
+    p.add_argument('--generations', type=int, default=50, help='gerações por caso')
+    p.add_argument('--mutation-rate', type=float, default=None, help='taxa de mutação (padrão: 1/n)')
+    p.add_argument('--representation', choices=REPRESENTATIONS, default='list', help='codificação do genoma')
+    for phase, registry in STRATEGIES.items():
+        p.add_argument(f'--{phase}', choices=list(registry), default=DEFAULT_STRATEGIES[phase], help=f'estratégia de {PHASE_NAMES[phase]} do AG')
+    p.add_argument('--replacement', choices=REPLACEMENTS, default='generational', help='substituição da população (compare ger/s e rss entre os modos)')
+    p.add_argument('--replace-count', type=int, default=None, help='indivíduos substituídos por geração no modo steady_state (padrão: 10%% da população, mínimo 2)')
+    p.add_argument('--operators', action='store_true', help='mede cada estratégia de seleção, crossover, mutação e reparo isoladamente, em vez do AG completo')
+    p.add_argument('--max-time', type=float, default=10.0, help='tempo máximo do AG por caso, em segundos')
+    p.add_argument('--eval-time', type=float, default=0.5, help='duração da medição isolada de evaluate, em segundos')
+    p.add_argument('--no-exact', action='store_true', help='não calcula o ótimo exato (qualidade fica nula)')
+    p.add_argument('--output', default='benchmark.json', help='arquivo JSON de resultados')
+    p.add_argument('--baseline', default=None, help='JSON de resultados anterior para detectar regressões')
+    p.add_argument('--tolerance', type=float, default=0.10, help='queda relativa tolerada antes de acusar regressão')
+    args = p.parse_args(argv)
+
+    params = {
+        'pop_size': args.pop_size,
+        'generations': args.generations,
+        'mutation_rate': args.mutation_rate,
+        'representation': args.representation,
+        'strategies': {phase: getattr(args, phase) for phase in STRATEGIES},
+        'replacement': args.replacement,
+        'replace_count': args.replace_count,
+        'max_time': args.max_time,
+        'eval_time': args.eval_time,
+        'exact': not args.no_exact,
+    }
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    kinds = [k.strip() for k in args.kinds.split(',') if k.strip()]
+
+    results = []
+    # one fresh process per case so peak RSS is not inherited from earlier, larger cases
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        for kind in kinds:
+            for n in sizes:
+                if args.operators:
+                    recs = pool.submit(run_operators, kind, n, args.seed, params).result()
+                    results.extend(recs)
+                    for rec in recs:
+                        print(f"{rec['case']:>48}: {rec['calls_per_sec']:>14.1f} chamadas/s")
+                    continue
+                rec = pool.submit(run_case, kind, n, args.seed, params).result()
+                results.append(rec)
+                quality = f"{rec['quality']:.4f}" if rec['quality'] is not None else '-'
+                print(f"{rec['case']:>28}: {rec['generations_per_sec']:>10.2f} ger/s  {rec['evaluations_per_sec']:>12.1f} aval/s  "
+                      f"qualidade={quality}  rss={rec['peak_rss_mb']:.1f}MB")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'params': params, 'results': results}, f, indent=2)
+    print(f'Resultados gravados em {args.output}')
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print('REGRESSÃO:', line)
+        if regressions:
+            return 1
+        print('Sem regressões em relação ao baseline.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -1,10 +1,21 @@
 
 import os
 import json
-from typing import List, Optional, Tuple
+import mmap
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
 
-_cache: dict[str, Tuple[List[dict], Optional[int]]] = {}
 _LAST_DIR_FILENAME = '.last_json_dir'
+_BINARY_MAGIC = b'KNAP'
+_BINARY_VERSION = 1
+# magic, version, flags (bit 0: has capacity), capacity, item count, names section length
+_BINARY_HEADER = struct.Struct('<4sHHqqq')
+_FORMAT_ERROR = 'Formato JSON inválido. Esperado: {"capacity": int (opcional), "items": [{"weight":int, "value":int}, ...]}'
+_DIMENSIONS_ERROR = 'Todos os itens devem ter o mesmo número de dimensões de peso.'
+_CAPACITY_ERROR = "Campo 'capacity' inválido. Deve ser um inteiro, uma lista de inteiros (uma por dimensão) ou uma lista de listas (uma por mochila)."
 
 
 def list_json_files(root: str) -> List[str]:
@@ -14,40 +25,386 @@ def list_json_files(root: str) -> List[str]:
         return []
 
 
-def load_problem_from_json(path: str) -> Tuple[List[dict], Optional[int]]:
-    """Carrega e retorna (items, capacity_or_None). Usa cache em memória se disponível."""
-    abs_path = os.path.abspath(path)
-    if abs_path in _cache:
-        return _cache[abs_path]
+class _JsonStream:
+    """Leitor incremental: decodifica um valor JSON por vez a partir de blocos do arquivo."""
+
+    def __init__(self, f, chunk_size: int = 1 << 20) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in ' \t\r\n':
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, ch: str) -> None:
+        if self.peek() != ch:
+            raise ValueError(_FORMAT_ERROR)
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self.buf, self.pos)
+                # a value ending exactly at the buffer edge may be truncated (e.g. a number)
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise ValueError(_FORMAT_ERROR)
+            self._fill()
+
+
+def _parse_capacity(value):
+    # int, [int per dimension] or [[int per dimension] per knapsack]
+    try:
+        if isinstance(value, list):
+            if value and isinstance(value[0], list):
+                return [[int(c) for c in row] for row in value]
+            return [int(c) for c in value]
+        return int(value)
+    except Exception:
+        raise ValueError(_CAPACITY_ERROR)
 
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    capacity = None
-    if 'capacity' in data and data['capacity'] is not None:
+
+def _parse_knapsacks(value) -> int:
+    try:
+        knapsacks = int(value)
+    except Exception:
+        knapsacks = 0
+    if not 1 <= knapsacks <= 255:
+        raise ValueError("Campo 'knapsacks' inválido. Deve ser um inteiro entre 1 e 255.")
+    return knapsacks
+
+
+class _WeightColumns:
+    """Acumula os pesos dos itens: o primeiro valor em `weights`, os demais em uma linha por dimensão extra."""
+
+    def __init__(self) -> None:
+        self.weights = array('q')
+        self.extra: Optional[List[array]] = None
+
+    def append(self, weight) -> None:
         try:
-            capacity = int(data['capacity'])
+            vector = [int(w) for w in weight] if isinstance(weight, list) else None
+            scalar = int(weight) if vector is None else None
         except Exception:
-            raise ValueError("Campo 'capacity' inválido. Deve ser um inteiro.")
+            raise ValueError(_FORMAT_ERROR)
+        if vector is not None:
+            if self.extra is None and not self.weights:
+                self.extra = [array('q') for _ in vector[1:]]
+            if self.extra is None or not vector or len(vector) != len(self.extra) + 1:
+                raise ValueError(_DIMENSIONS_ERROR)
+            self.weights.append(vector[0])
+            for row, w in zip(self.extra, vector[1:]):
+                row.append(w)
+        else:
+            if self.extra is not None:
+                raise ValueError(_DIMENSIONS_ERROR)
+            self.weights.append(scalar)
+
+
+def _scan_instance(path: str, on_item: Callable[[dict], None]) -> Tuple[Optional[object], int]:
+    """Percorre o JSON chamando on_item para cada elemento de 'items'; retorna (capacidade, nº de mochilas)."""
+    capacity = None
+    knapsacks = 1
+    found_items = False
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = _JsonStream(f)
+        stream.expect('{')
+        if stream.peek() == '}':
+            raise ValueError(_FORMAT_ERROR)
+        while True:
+            key = stream.value()
+            stream.expect(':')
+            if key == 'items':
+                found_items = True
+                stream.expect('[')
+                if stream.peek() == ']':
+                    stream.pos += 1
+                else:
+                    while True:
+                        on_item(stream.value())
+                        sep = stream.peek()
+                        stream.pos += 1
+                        if sep == ']':
+                            break
+                        if sep != ',':
+                            raise ValueError(_FORMAT_ERROR)
+            else:
+                value = stream.value()
+                if key == 'capacity' and value is not None:
+                    capacity = _parse_capacity(value)
+                elif key == 'knapsacks' and value is not None:
+                    knapsacks = _parse_knapsacks(value)
+            sep = stream.peek()
+            stream.pos += 1
+            if sep == '}':
+                break
+            if sep != ',':
+                raise ValueError(_FORMAT_ERROR)
+        # only whitespace may follow the top-level object, as with json.load
+        if stream.peek():
+            raise ValueError(_FORMAT_ERROR)
+
+    if not found_items:
+        raise ValueError(_FORMAT_ERROR)
+    return capacity, knapsacks
+
+
+class Instance:
+    """Instância carregada: pesos e valores em arrays tipados; nomes lidos sob demanda.
+
+    Em instâncias multidimensionais, `weights` é a primeira dimensão e `extra_weights` traz as demais
+    (uma linha por dimensão); `capacity` pode então ser um vetor ou uma lista de vetores (um por mochila).
+    """
+
+    __slots__ = ('path', 'capacity', 'weights', 'values', '_names', '_names_loader', 'extra_weights', 'knapsacks')
+
+    def __init__(
+        self,
+        path: str,
+        capacity,
+        weights,
+        values,
+        names: Optional[List[Optional[str]]] = None,
+        names_loader: Optional[Callable[[], List[Optional[str]]]] = None,
+        extra_weights: Optional[List[array]] = None,
+        knapsacks: int = 1,
+    ) -> None:
+        self.path = path
+        self.capacity = capacity
+        self.weights = weights
+        self.values = values
+        self._names = names
+        self._names_loader = names_loader
+        self.extra_weights = extra_weights or []
+        self.knapsacks = knapsacks
+
+    @property
+    def multi(self) -> bool:
+        return bool(self.extra_weights) or self.knapsacks > 1 or isinstance(self.capacity, list)
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    @property
+    def names(self) -> List[Optional[str]]:
+        if self._names is None:
+            if self._names_loader is not None:
+                self._names = self._names_loader()
+            else:
+                names: List[Optional[str]] = []
+                _scan_instance(self.path, lambda it: names.append(it.get('name') if isinstance(it, dict) else None))
+                self._names = names
+        return self._names
+
+    @property
+    def nbytes(self) -> int:
+        size = self.weights.itemsize * len(self.weights) + self.values.itemsize * len(self.values)
+        size += sum(row.itemsize * len(row) for row in self.extra_weights)
+        if self._names is not None:
+            size += 8 * len(self._names) + sum(len(n) for n in self._names if n)
+        return size
+
+
+class InstanceCache:
+    """Cache LRU limitado em bytes, chaveado por caminho e validado por mtime/tamanho do arquivo."""
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.max_bytes = int(max_bytes)
+        self._data: OrderedDict[str, Tuple[Tuple[int, int], Instance]] = OrderedDict()
+
+    @staticmethod
+    def _stamp(abs_path: str) -> Tuple[int, int]:
+        st = os.stat(abs_path)
+        return st.st_mtime_ns, st.st_size
+
+    def get(self, path: str) -> Optional[Instance]:
+        abs_path = os.path.abspath(path)
+        entry = self._data.get(abs_path)
+        if entry is None:
+            return None
+        try:
+            fresh = entry[0] == self._stamp(abs_path)
+        except OSError:
+            fresh = False
+        if not fresh:
+            del self._data[abs_path]
+            return None
+        self._data.move_to_end(abs_path)
+        return entry[1]
+
+    def put(self, path: str, instance: Instance) -> None:
+        abs_path = os.path.abspath(path)
+        self._data[abs_path] = (self._stamp(abs_path), instance)
+        self._data.move_to_end(abs_path)
+        while len(self._data) > 1 and self.total_bytes() > self.max_bytes:
+            self._data.popitem(last=False)
+
+    def total_bytes(self) -> int:
+        return sum(inst.nbytes for _, inst in self._data.values())
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_cache = InstanceCache()
+
 
+def is_binary_instance(path: str) -> bool:
     try:
-        items = [
-            {
-                'name': it.get('name') if isinstance(it, dict) else None,
-                'weight': int(it['weight']),
-                'value': int(it['value'])
-            }
-            for it in data['items']
-        ]
-    except Exception:
-        raise ValueError('Formato JSON inválido. Esperado: {"capacity": int (opcional), "items": [{"weight":int, "value":int}, ...]}')
+        with open(path, 'rb') as f:
+            return f.read(len(_BINARY_MAGIC)) == _BINARY_MAGIC
+    except OSError:
+        return False
+
+
+def write_binary_instance(instance: Instance, path: str, with_names: bool = True) -> None:
+    """Grava a instância no formato binário: cabeçalho + pesos e valores int64 contíguos (+ nomes opcionais)."""
+    if instance.multi:
+        raise ValueError('O formato binário suporta apenas uma dimensão de peso e uma mochila.')
+    weights = array('q', instance.weights)
+    values = array('q', instance.values)
+    names_blob = b''
+    if with_names and any(instance.names):
+        names_blob = json.dumps(instance.names, ensure_ascii=False).encode('utf-8')
+    if sys.byteorder != 'little':
+        weights.byteswap()
+        values.byteswap()
+    flags = 1 if instance.capacity is not None else 0
+    with open(path, 'wb') as f:
+        f.write(_BINARY_HEADER.pack(_BINARY_MAGIC, _BINARY_VERSION, flags, instance.capacity or 0, len(weights), len(names_blob)))
+        f.write(weights.tobytes())
+        f.write(values.tobytes())
+        f.write(names_blob)
+
+
+def convert_json_to_binary(src: str, dst: str) -> Instance:
+    instance = load_instance(src)
+    write_binary_instance(instance, dst)
+    return instance
+
+
+def load_binary_instance(path: str) -> Instance:
+    """Mapeia o arquivo binário em memória (mmap); pesos e valores são views sem cópia sobre as páginas do arquivo."""
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mm) < _BINARY_HEADER.size:
+        raise ValueError('Arquivo binário de instância truncado.')
+    magic, version, flags, capacity, n, names_len = _BINARY_HEADER.unpack_from(mm, 0)
+    if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+        raise ValueError('Arquivo binário de instância inválido ou de versão não suportada.')
+    offset = _BINARY_HEADER.size
+    end = offset + 16 * n
+    if len(mm) < end + names_len:
+        raise ValueError('Arquivo binário de instância truncado.')
+
+    buf = memoryview(mm)
+    if sys.byteorder == 'little':
+        weights = buf[offset:offset + 8 * n].cast('q')
+        values = buf[offset + 8 * n:end].cast('q')
+    else:
+        weights, values = array('q', buf[offset:offset + 8 * n]), array('q', buf[offset + 8 * n:end])
+        weights.byteswap()
+        values.byteswap()
+
+    def names_loader() -> List[Optional[str]]:
+        if not names_len:
+            return [None] * n
+        return json.loads(bytes(buf[end:end + names_len]).decode('utf-8'))
+
+    return Instance(os.path.abspath(path), capacity if flags & 1 else None, weights, values, names_loader=names_loader)
+
+
+def load_instance(path: str) -> Instance:
+    """Carrega a instância (JSON em streaming ou binário via mmap) em arrays de pesos/valores. Usa cache em memória se disponível."""
+    cached = _cache.get(path)
+    if cached is not None:
+        return cached
+
+    if is_binary_instance(path):
+        instance = load_binary_instance(path)
+        _cache.put(path, instance)
+        return instance
+
+    columns = _WeightColumns()
+    values = array('q')
+
+    def on_item(it: dict) -> None:
+        try:
+            weight, value = it['weight'], int(it['value'])
+        except Exception:
+            raise ValueError(_FORMAT_ERROR)
+        columns.append(weight)
+        values.append(value)
+
+    capacity, knapsacks = _scan_instance(path, on_item)
+    instance = Instance(os.path.abspath(path), capacity, columns.weights, values, extra_weights=columns.extra, knapsacks=knapsacks)
+    _cache.put(path, instance)
+    return instance
+
+
+def instance_from_dict(data: dict) -> Instance:
+    """Instância a partir de um JSON já decodificado (mesmo esquema do arquivo), sem passar pelo cache."""
+    if not isinstance(data, dict) or not isinstance(data.get('items'), list):
+        raise ValueError(_FORMAT_ERROR)
+    capacity = data.get('capacity')
+    if capacity is not None:
+        capacity = _parse_capacity(capacity)
+    knapsacks = _parse_knapsacks(data['knapsacks']) if data.get('knapsacks') is not None else 1
+    columns = _WeightColumns()
+    values = array('q')
+    names: List[Optional[str]] = []
+    for it in data['items']:
+        try:
+            weight, value = it['weight'], int(it['value'])
+        except Exception:
+            raise ValueError(_FORMAT_ERROR)
+        columns.append(weight)
+        values.append(value)
+        names.append(it.get('name'))
+    return Instance('<inline>', capacity, columns.weights, values, names=names, extra_weights=columns.extra, knapsacks=knapsacks)
+
 
-    _cache[abs_path] = (items, capacity)
-    return items, capacity
+def load_problem_from_json(path: str) -> Tuple[List[dict], Optional[int]]:
+    """Carrega e retorna (items, capacity_or_None). Mantido por compatibilidade; prefira load_instance."""
+    inst = load_instance(path)
+    items = [
+        {'name': name, 'weight': w, 'value': v}
+        for name, w, v in zip(inst.names, inst.weights, inst.values)
+    ]
+    return items, inst.capacity
 
 
-def get_cached(path: str) -> Optional[Tuple[List[dict], int]]:
-    return _cache.get(os.path.abspath(path))
+def get_cached(path: str) -> Optional[Instance]:
+    return _cache.get(path)
 
 
 def save_last_dir(root: str, path: str) -> None:
@@ -12,11 +12,19 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 # Import project modules
-from problem.problem import Item, KnapsackProblem
-from algorithms.ga import GeneticAlgorithm
+from problem.problem import KnapsackProblem
+from problem.preprocessing import Reduction, reduce_problem
+from algorithms.ga import GeneticAlgorithm, REPLACEMENTS, REPRESENTATIONS, SEEDINGS
+from algorithms.operators import CROSSOVERS, MUTATIONS, REPAIRS, SELECTIONS
+from algorithms.ga_numpy import NumpyGeneticAlgorithm
+from algorithms.islands import IslandModel, TOPOLOGIES
+from algorithms.warmstart import WarmStartStore
+from algorithms.history import HISTORY_POLICIES
+from algorithms.exact import SOLVERS, BranchAndBoundSolver, DynamicProgrammingSolver, choose_solver
 from json_utils import (
     list_json_files,
-    load_problem_from_json as load_problem_from_json_local,
+    load_instance,
+    write_binary_instance,
     choose_file_interactive,
     choose_file_system,
     save_last_dir,
@@ -29,21 +37,51 @@ def prompt_yes_no(message: str, default: str = 's') -> bool:
     return response.startswith('s')
 
 
-def print_history_table(history: list[dict]) -> None:
+PHASE_LABELS = {
+    'selection': 'sel',
+    'crossover': 'cx',
+    'mutation': 'mut',
+    'repair': 'rep',
+    'evaluation': 'aval',
+}
+
+
+def print_history_table(history) -> None:
     if not history:
         print("(sem histórico)")
         return
 
-    headers = ["ger", "valor", "fitness", "média", "mut", "cross", "peso", "t(s)"]
+    with_island = "island" in history[0]
+    headers = (["ilha"] if with_island else []) + ["ger", "valor", "fitness", "média", "mut", "cross", "peso", "reparo", "cache h/m", "t(s)"]
+    # adaptation trace and per-phase timing columns, present only when the GA ran with them enabled
+    adaptive = "mutation_rate" in history[0]
+    if adaptive:
+        headers += ["div", "p_mut", "p_cross", "torneio"]
+    metrics = "unique_genomes" in history[0]
+    if metrics:
+        headers += ["únicos", "hamming", "entropia"]
+    dedup = "duplicates" in history[0]
+    if dedup:
+        headers += ["dup"]
+    restart = "restarted" in history[0]
+    if restart:
+        headers += ["reinício"]
+    phases = [phase for phase in PHASE_LABELS if f"time_{phase}" in history[0]]
+    headers += [f"{PHASE_LABELS[phase]}(ms)" for phase in phases]
 
     table: list[list[str]] = []
-    prev_total = 0.0
+    prev_total, prev_gen = 0.0, -1
+    prev_island = None
     for rec in history:
+        if with_island and rec["island"] != prev_island:
+            prev_island, prev_total, prev_gen = rec["island"], 0.0, -1
         total = float(rec.get("elapsed", 0.0))
-        gen_time = max(0.0, total - prev_total)
-        prev_total = total
+        # a bounded history may skip generations: show the average time per generation since the previous row
+        gen = rec.get("gen", prev_gen + 1)
+        gen_time = max(0.0, total - prev_total) / max(1, gen - prev_gen)
+        prev_total, prev_gen = total, gen
 
-        row = [
+        row = ([str(rec["island"])] if with_island else []) + [
             str(rec.get("gen", "-")),
             str(int(rec.get("best_value", 0))),
             f"{rec.get('best_fitness', 0):.2f}",
@@ -51,8 +89,19 @@ def print_history_table(history: list[dict]) -> None:
             str(rec.get("mutations", 0)),
             str(rec.get("crossovers", 0)),
             str(rec.get("best_weight", "-")),
+            str(rec.get("repair_steps", "-")),
+            f"{rec['cache_hits']}/{rec['cache_misses']}" if "cache_hits" in rec else "-",
             f"{gen_time:.4f}",
         ]
+        if adaptive:
+            row += [f"{rec['diversity']:.3f}", f"{rec['mutation_rate']:.4f}", f"{rec['crossover_rate']:.2f}", str(rec["tournament_size"])]
+        if metrics:
+            row += [str(rec["unique_genomes"]), f"{rec['hamming']:.3f}", f"{rec['gene_entropy']:.3f}"]
+        if dedup:
+            row += [str(rec["duplicates"])]
+        if restart:
+            row += ["sim" if rec["restarted"] else ""]
+        row += [f"{rec[f'time_{phase}'] * 1000:.2f}" for phase in phases]
         table.append(row)
 
     widths = [max(len(headers[i]), max(len(row[i]) for row in table)) for i in range(len(headers))]
@@ -65,8 +114,8 @@ def print_history_table(history: list[dict]) -> None:
 
 
 def load_problem_from_json(path: str, provided_capacity: Optional[int] = None):
-    items_data, capacity = load_problem_from_json_local(path)
-    capacity = capacity or provided_capacity
+    instance = load_instance(path)
+    capacity = instance.capacity or provided_capacity
 
     if capacity is None:
         if sys.stdin is not None and sys.stdin.isatty():
@@ -87,15 +136,9 @@ def load_problem_from_json(path: str, provided_capacity: Optional[int] = None):
             print(f"Erro: o arquivo {path} não contém 'capacity'. Passe --capacity na linha de comando ou adicione 'capacity' ao JSON.")
             sys.exit(1)
 
-    items = [
-        Item(
-            name=it.get('name') if isinstance(it, dict) else None,
-            weight=it['weight'],
-            value=it['value']
-        )
-        for it in items_data
-    ]
-    return items, capacity
+    # names are only read from disk if the selected items get printed
+    return KnapsackProblem.from_arrays(instance.weights, instance.values, capacity, names=lambda: instance.names,
+                                       extra_weights=instance.extra_weights, knapsacks=instance.knapsacks)
 
 
 def prompt(prompt_text: str, default: Optional[str] = None) -> str:
@@ -120,7 +163,8 @@ def _print_selected_items(best, items, capacity):
         for display_num, idx in enumerate(selected_sorted, start=1):
             item = items[idx]
             name = item.name or f'Item_{idx+1}'
-            print(f'  {display_num}) {name} — peso={item.weight}, valor={item.value}')
+            weight = f'pesos={item.weights}' if item.weights else f'peso={item.weight}'
+            print(f'  {display_num}) {name} — {weight}, valor={item.value}')
             total_value += item.value
             total_weight += item.weight
 
@@ -131,17 +175,94 @@ def _print_selected_items(best, items, capacity):
         pass
 
 
-def run_ga(items, capacity, pop_size, generations, mutation_rate, record_history: bool, print_history: bool, max_time: Optional[float]):
-    problem = KnapsackProblem(items, capacity, penalty_factor=10.0)
-    ga = GeneticAlgorithm(problem, pop_size=pop_size, generations=generations, mutation_rate=mutation_rate)
+def _print_knapsack_loads(best, problem):
+    """Carga de cada mochila em cada dimensão, para instâncias multidimensionais ou com várias mochilas."""
+    loads = problem.loads(best)
+    dims = len(problem.dimensions)
+    print('\nCarga por mochila (por dimensão):')
+    for k, capacity in enumerate(problem.capacities):
+        count = sum(1 for g in best if g == k + 1)
+        print(f'  Mochila {k + 1}: {count} itens — carga={tuple(loads[k * dims:(k + 1) * dims])} / {capacity}')
+
+
+ENGINES = {
+    'list': GeneticAlgorithm,
+    'numpy': NumpyGeneticAlgorithm,
+}
+
+
+def run_ga(problem, pop_size, generations, mutation_rate, record_history: bool, print_history: bool, max_time: Optional[float], engine: str = 'list', islands: int = 1, migration_interval: int = 10, migrants: int = 2, topology: str = 'ring', representation: str = 'list', profile: bool = False, trace_path: Optional[str] = None,
+           seeding: str = 'random', seed_fraction: float = 0.1, checkpoint: Optional[dict] = None, adaptive: bool = False,
+           selection: str = 'tournament', crossover: str = 'one_point', mutation: str = 'flip', repair: str = 'ratio',
+           dedup: bool = False, diversity_metrics: bool = False, restart_threshold: Optional[float] = None,
+           replacement: str = 'generational', replace_count: Optional[int] = None,
+           history_limit: Optional[int] = None, history_policy: str = 'ring', history_path: Optional[str] = None,
+           reduction: Optional[Reduction] = None, warm_start: Optional[str] = None):
+    strategies = {'selection': selection, 'crossover': crossover, 'mutation': mutation, 'repair': repair,
+                  'dedup': dedup, 'diversity_metrics': diversity_metrics, 'restart_threshold': restart_threshold,
+                  'replacement': replacement, 'replace_count': replace_count,
+                  'history_limit': history_limit, 'history_policy': history_policy}
+    capacity = problem.capacity
+    # with preprocessing the GA only sees the core items; the answer is mapped back to the full genome below
+    ga_problem = reduction.problem if reduction is not None else problem
+    if islands > 1:
+        ga = IslandModel(ga_problem, islands=islands, migration_interval=migration_interval, migrants=migrants, topology=topology,
+                         pop_size=pop_size, generations=generations, mutation_rate=mutation_rate, representation=representation,
+                         seeding=seeding, seed_fraction=seed_fraction, adaptive=adaptive, **strategies)
+        print(f"Modelo de ilhas: {islands} ilhas, migração a cada {migration_interval} gerações ({topology})")
+    else:
+        extra = {
+            'representation': representation,
+            'profile': profile,
+            'trace': bool(trace_path),
+            'seeding': seeding,
+            'seed_fraction': seed_fraction,
+            'adaptive': adaptive,
+            **strategies,
+        } if engine == 'list' else {}
+        ga = ENGINES[engine](ga_problem, pop_size=pop_size, generations=generations, mutation_rate=mutation_rate, **extra)
     
     print(f"Tempo máximo: {max_time or 'sem limite'} {'segundos' if max_time else ''}")
     
     stable_limit = 15
+    if isinstance(ga, GeneticAlgorithm) and ga.replacement == 'steady_state':
+        # a steady-state generation only replaces replace_count individuals: count stability in whole populations
+        stable_limit *= max(1, ga.pop_size // ga.replace_count)
     print(f"Critério: parar quando o mesmo melhor for encontrado {stable_limit} vezes consecutivas")
     
     start = time.perf_counter()
-    best, total_value, total_weight = ga.evolve(record_history=record_history, max_time=max_time, show_progress=False, stable_limit=stable_limit)
+    if checkpoint and not isinstance(ga, GeneticAlgorithm):
+        print('Aviso: checkpoint só é suportado pelo motor list sem ilhas; ignorando --checkpoint.')
+        checkpoint = None
+    if history_path and not isinstance(ga, GeneticAlgorithm):
+        print('Aviso: gravação do histórico em arquivo só é suportada pelo motor list sem ilhas; ignorando --history-out.')
+        history_path = None
+    if warm_start and not isinstance(ga, GeneticAlgorithm):
+        print('Aviso: warm start só é suportado pelo motor list sem ilhas; ignorando --warm-start.')
+        warm_start = None
+
+    run_kwargs = dict(checkpoint or {})
+    if history_path:
+        run_kwargs['history_path'] = history_path
+    store = WarmStartStore(warm_start) if warm_start else None
+    if store is not None and 'resume_from' not in run_kwargs:
+        entry = store.load(problem)
+        if entry is None:
+            print(f'Warm start: nenhuma execução anterior compatível em {warm_start}')
+        else:
+            genomes = store.genomes(entry, problem)
+            if reduction is not None:
+                genomes = [[genes[i] for i in reduction.core] for genes in genomes]
+            run_kwargs['initial_population'] = ga.population_from(genomes)
+            print(f"Warm start: {len(genomes)} genomas de uma execução anterior ({entry['overlap']:.0%} dos itens em comum, melhor valor {entry['best_value']})")
+
+    best, total_value, total_weight = ga.evolve(record_history=record_history, max_time=max_time, show_progress=False, stable_limit=stable_limit, **run_kwargs)
+    if reduction is not None:
+        best = reduction.expand(best)
+        _, total_value, total_weight = problem.evaluate(best)
+    if store is not None:
+        expand = reduction.expand if reduction is not None else list
+        store.save(problem, [expand(ga.genes(ind)) for ind in ga.population], best, total_value)
     
     elapsed = time.perf_counter() - start
 
@@ -150,7 +271,14 @@ def run_ga(items, capacity, pop_size, generations, mutation_rate, record_history
     print(f'Peso total: {total_weight} / {capacity}')
     print(f'Tempo de execução: {elapsed:.4f} s')
 
-    _print_selected_items(best, items, capacity)
+    _print_selected_items(best, problem.items, capacity)
+    if problem.multi:
+        _print_knapsack_loads(best, problem)
+
+    profiler = getattr(ga, 'profiler', None)
+    if profiler is not None and trace_path:
+        profiler.export_chrome_trace(trace_path)
+        print(f'Linha do tempo (Chrome trace) gravada em {trace_path}')
 
     if print_history and ga.history:
         print('\nHistórico por geração (gen, best_fitness, avg_fitness, mutations, crossovers, best_weight, elapsed_s):')
@@ -160,6 +288,30 @@ def run_ga(items, capacity, pop_size, generations, mutation_rate, record_history
     return best, total_value, total_weight, ga
 
 
+EXACT_SOLVERS = {
+    'dp': DynamicProgrammingSolver,
+    'bnb': BranchAndBoundSolver,
+}
+
+
+def run_exact(problem, solver: str, max_time: Optional[float]):
+    capacity = problem.capacity
+    exact = EXACT_SOLVERS[solver](problem)
+    print(f"Solver exato: {solver} — tempo máximo: {max_time or 'sem limite'} {'segundos' if max_time else ''}")
+
+    start = time.perf_counter()
+    best, total_value, total_weight = exact.solve(max_time=max_time)
+    elapsed = time.perf_counter() - start
+
+    print(f'\n({solver.upper()}) Melhor indivíduo binário:', best)
+    print(f'Valor total: {total_value}' + ('' if exact.proven_optimal else ' (melhor encontrado; otimalidade não provada no tempo limite)'))
+    print(f'Peso total: {total_weight} / {capacity}')
+    print(f'Tempo de execução: {elapsed:.4f} s')
+
+    _print_selected_items(best, problem.items, capacity)
+    return best, total_value, total_weight, exact
+
+
 def choose_parameters(items, capacity):
     n = max(1, len(items))
     pop = int(min(200, max(20, 10 * n)))
@@ -193,9 +345,9 @@ def interactive():
 
         save_last_dir(ROOT, os.path.dirname(path))
 
-        items, capacity = load_problem_from_json(path)
+        problem = load_problem_from_json(path)
         if prompt_yes_no('Selecionar parâmetros automaticamente?', True):
-            pop_size, generations, mutation_rate = choose_parameters(items, capacity)
+            pop_size, generations, mutation_rate = choose_parameters(problem.items, problem.capacity)
             print(f"Parâmetros selecionados automaticamente: pop_size={pop_size}, generations={generations}, mutation_rate={mutation_rate:.3f}")
         else:
             pop_size = int(prompt('Tamanho da população', '80'))
@@ -204,7 +356,7 @@ def interactive():
 
         max_time = 5.0
         print('\nExecutando... (Ctrl+C para parar)')
-        best, total_value, total_weight, ga = run_ga(items, capacity, pop_size, generations, mutation_rate, record_history=True, print_history=False, max_time=max_time)
+        best, total_value, total_weight, ga = run_ga(problem, pop_size, generations, mutation_rate, record_history=True, print_history=False, max_time=max_time)
 
         if prompt_yes_no('Mostrar histórico por geração?', False) and ga.history:
             print('\nHistórico por geração (gen, best_fitness, avg_fitness, mutations, crossovers, best_weight, elapsed_s):')
@@ -218,7 +370,8 @@ def interactive():
 def non_interactive(argv: list[str]):
     import argparse
     p = argparse.ArgumentParser()
-    p.add_argument('--input', required=True, help='Arquivo JSON com a definição do problema')
+    p.add_argument('--input', required=True, help='Arquivo com a definição do problema (JSON ou binário gerado por --to-binary)')
+    p.add_argument('--to-binary', metavar='ARQUIVO', default=None, help='converte a instância de --input para o formato binário compacto e sai')
     p.add_argument('--auto', action='store_true', help='seleciona parâmetros do AG automaticamente com base no tamanho do problema')
     p.add_argument('--show', choices=['s', 'n'], default='n', help='mostrar histórico por geração (s/n)')
     p.add_argument('--pop-size', type=int, default=80, help='tamanho da população')
@@ -226,22 +379,107 @@ def non_interactive(argv: list[str]):
     p.add_argument('--mutation-rate', type=float, default=0.02, help='taxa de mutação por gene')
     p.add_argument('--max-time', type=float, default=5.0, help='tempo máximo de execução em segundos (padrão: 5)')
     p.add_argument('--capacity', type=int, default=None, help='capacidade (peso máximo) a usar se o JSON não contiver "capacity"')
+    p.add_argument('--representation', choices=REPRESENTATIONS, default='list', help='codificação do genoma no motor list: lista 0/1 ou bits empacotados em um int')
+    p.add_argument('--seeding', choices=SEEDINGS, default='random', help='população inicial: random (genes 0/1 uniformes) ou greedy (guloso, relaxação linear e perturbações + genes aleatórios calibrados pela capacidade)')
+    p.add_argument('--seed-fraction', type=float, default=0.1, help='fração da população inicial semeada no modo greedy')
+    p.add_argument('--adaptive', action='store_true', help='ajusta mutação, crossover e tamanho do torneio durante a execução conforme diversidade e melhora (motor list)')
+    p.add_argument('--selection', choices=list(SELECTIONS), default='tournament', help='seleção de pais (motor list)')
+    p.add_argument('--crossover', choices=list(CROSSOVERS), default='one_point', help='operador de crossover (motor list)')
+    p.add_argument('--mutation', choices=list(MUTATIONS), default='flip', help='operador de mutação (motor list); swap mantém o nº de itens')
+    p.add_argument('--repair', choices=list(REPAIRS), default='ratio', help='reparo (motor list); none deixa inviáveis com penalidade')
+    p.add_argument('--dedup', action='store_true', help='elimina filhos repetidos em cada geração (nova mutação ou indivíduo novo) (motor list)')
+    p.add_argument('--diversity', action='store_true', help='registra no histórico genótipos distintos, Hamming médio amostrado e entropia por gene (motor list)')
+    p.add_argument('--restart-threshold', type=float, default=None, help='reinicia a população (mantendo o melhor) quando o Hamming médio normalizado cai abaixo deste valor (motor list)')
+    p.add_argument('--replacement', choices=REPLACEMENTS, default='generational', help='substituição da população: generational (nova lista a cada geração), buffered (duas populações pré-alocadas, filhos escritos nos indivíduos existentes) ou steady_state (troca só os --replace-count piores por geração) (motor list)')
+    p.add_argument('--replace-count', type=int, default=None, help='indivíduos substituídos por geração no modo steady_state (padrão: 10%% da população, mínimo 2)')
+    p.add_argument('--preprocess', action='store_true', help='reduz a instância antes do AG: descarta itens impossíveis e fixa variáveis pelo limite da relaxação linear (exato)')
+    p.add_argument('--core-size', type=int, default=None, help='entrega ao AG só os N itens indecisos em torno do item crítico; os demais ficam com o valor da relaxação linear (heurístico, implica --preprocess)')
+    p.add_argument('--history-limit', type=int, default=None, help='guarda no máximo N registros do histórico em memória (motor list)')
+    p.add_argument('--history-policy', choices=HISTORY_POLICIES, default='ring', help='com --history-limit: ring (os N mais recentes) ou downsample (N registros espaçados ao longo de toda a execução)')
+    p.add_argument('--history-out', metavar='ARQUIVO', default=None, help='grava cada registro do histórico no arquivo durante a execução: CSV se terminar em .csv, senão JSON Lines (motor list sem ilhas)')
+    p.add_argument('--profile', action='store_true', help='mede tempo e chamadas por operador (seleção, crossover, mutação, reparo, avaliação) no histórico')
+    p.add_argument('--trace', metavar='ARQUIVO', default=None, help='grava a linha do tempo dos operadores em formato Chrome trace (JSON)')
+    p.add_argument('--checkpoint', metavar='ARQUIVO', default=None, help='grava o estado completo do AG neste arquivo (periodicamente e ao final)')
+    p.add_argument('--checkpoint-every', type=int, default=50, help='gerações entre checkpoints (0 desativa o critério)')
+    p.add_argument('--checkpoint-seconds', type=float, default=None, help='segundos entre checkpoints')
+    p.add_argument('--resume', action='store_true', help='retoma a execução a partir de --checkpoint, se o arquivo existir')
+    p.add_argument('--warm-start', metavar='DIR', default=None, help='semeia o AG com a população final da execução anterior da mesma instância (ou de uma parecida, mapeando itens pelo nome) e grava a população final neste diretório')
+    p.add_argument('--islands', type=int, default=1, help='número de ilhas (populações em processos paralelos); 1 desativa o modelo de ilhas')
+    p.add_argument('--migration-interval', type=int, default=10, help='gerações entre migrações no modelo de ilhas')
+    p.add_argument('--migrants', type=int, default=2, help='melhores indivíduos enviados por ilha a cada migração')
+    p.add_argument('--topology', choices=TOPOLOGIES, default='ring', help='topologia de migração entre ilhas')
+    p.add_argument('--solver', choices=SOLVERS, default='ga', help='método: ga, dp (programação dinâmica), bnb (branch-and-bound) ou auto (escolhe pelo custo estimado)')
+    p.add_argument('--engine', choices=sorted(ENGINES), default='list', help='motor do AG: list (stdlib) ou numpy (população vetorizada)')
     args = p.parse_args(argv)
 
     if not os.path.exists(args.input):
         print('Input file not found:', args.input)
         return
 
-    items, capacity = load_problem_from_json(args.input, provided_capacity=args.capacity)
+    if args.to_binary:
+        instance = load_instance(args.input)
+        if instance.multi:
+            print('O formato binário suporta apenas uma dimensão de peso e uma mochila; use a instância JSON diretamente.')
+            return
+        write_binary_instance(instance, args.to_binary)
+        print(f'Instância com {len(instance)} itens gravada em {args.to_binary}')
+        return
+
+    problem = load_problem_from_json(args.input, provided_capacity=args.capacity)
     show = args.show == 's'
+    reduction = None
+    if args.preprocess or args.core_size:
+        reduction = reduce_problem(problem, core_size=args.core_size)
+        print(reduction.summary())
     if args.auto:
-        pop_size, generations, mutation_rate = choose_parameters(items, capacity)
+        ga_problem = reduction.problem if reduction is not None else problem
+        pop_size, generations, mutation_rate = choose_parameters(ga_problem.items, ga_problem.capacity)
         print(f"Auto-selected parameters: pop_size={pop_size}, generations={generations}, mutation_rate={mutation_rate:.3f}")
     else:
         pop_size, generations, mutation_rate = args.pop_size, args.generations, args.mutation_rate
 
+    checkpoint = None
+    if args.checkpoint:
+        checkpoint = {
+            'checkpoint_path': args.checkpoint,
+            'checkpoint_every': args.checkpoint_every or None,
+            'checkpoint_seconds': args.checkpoint_seconds,
+        }
+        if args.resume and os.path.exists(args.checkpoint):
+            checkpoint['resume_from'] = args.checkpoint
+            print(f'Retomando a partir do checkpoint {args.checkpoint}')
+    elif args.resume:
+        print('--resume requer --checkpoint ARQUIVO')
+        return
+
+    solver = args.solver
+    if solver == 'auto':
+        solver = choose_solver(problem, args.max_time)
+        print(f'Solver escolhido automaticamente: {solver}')
+    if solver in EXACT_SOLVERS and problem.multi:
+        print('Solvers exatos não suportam várias dimensões ou mochilas. Executando o AG.')
+    elif solver in EXACT_SOLVERS:
+        try:
+            run_exact(problem, solver, max_time=args.max_time)
+            return
+        except TimeoutError as exc:
+            print(f'{exc} Executando o AG.')
+
+    engine, representation = args.engine, args.representation
+    if problem.multi and (engine != 'list' or representation != 'list'):
+        print('Várias dimensões ou mochilas só são suportadas pelo motor list com representação list. Usando --engine list --representation list.')
+        engine, representation = 'list', 'list'
+
     # In non-interactive mode: record and print history only if --show is 's'
-    run_ga(items, capacity, pop_size, generations, mutation_rate, record_history=show, print_history=show, max_time=args.max_time)
+    run_ga(problem, pop_size, generations, mutation_rate, record_history=show, print_history=show, max_time=args.max_time, engine=engine,
+           islands=args.islands, migration_interval=args.migration_interval, migrants=args.migrants, topology=args.topology,
+           representation=representation, profile=args.profile, trace_path=args.trace,
+           seeding=args.seeding, seed_fraction=args.seed_fraction, checkpoint=checkpoint, adaptive=args.adaptive,
+           selection=args.selection, crossover=args.crossover, mutation=args.mutation, repair=args.repair,
+           dedup=args.dedup, diversity_metrics=args.diversity, restart_threshold=args.restart_threshold, reduction=reduction,
+           replacement=args.replacement, replace_count=args.replace_count,
+           history_limit=args.history_limit, history_policy=args.history_policy, history_path=args.history_out,
+           warm_start=args.warm_start)
 
 
 if __name__ == '__main__':
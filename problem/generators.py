@@ -0,0 +1,40 @@
+import random
+from array import array
+from typing import Optional
+
+from problem.problem import KnapsackProblem
+
+KINDS = ('uncorrelated', 'weakly_correlated', 'strongly_correlated', 'subset_sum')
+
+
+def generate_instance(
+    n: int,
+    kind: str = 'uncorrelated',
+    seed: Optional[int] = None,
+    max_weight: int = 1000,
+    capacity_ratio: float = 0.5,
+) -> KnapsackProblem:
+    """Gera uma instância sintética reprodutível nas classes clássicas de Pisinger.
+
+    A capacidade é `capacity_ratio` vezes a soma dos pesos.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Classe de instância inválida: {kind}. Use uma de {', '.join(KINDS)}.")
+    rng = random.Random(seed)
+    spread = max(1, max_weight // 10)
+    weights = array('q')
+    values = array('q')
+    for _ in range(n):
+        w = rng.randint(1, max_weight)
+        if kind == 'uncorrelated':
+            v = rng.randint(1, max_weight)
+        elif kind == 'weakly_correlated':
+            v = rng.randint(max(1, w - spread), w + spread)
+        elif kind == 'strongly_correlated':
+            v = w + spread
+        else:
+            v = w
+        weights.append(w)
+        values.append(v)
+    capacity = max(1, int(sum(weights) * capacity_ratio))
+    return KnapsackProblem.from_arrays(weights, values, capacity)
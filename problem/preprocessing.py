@@ -0,0 +1,195 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate, compress
+from typing import List, Optional, Sequence
+
+from problem.problem import KnapsackProblem
+
+
+@dataclass
+class Reduction:
+    """Problema reduzido entregue ao AG e o necessário para voltar ao genoma completo.
+
+    `core[k]` é o índice original do k-ésimo item do problema reduzido; `fixed` tem um gene por item
+    original, com o valor decidido no pré-processamento (os itens do núcleo ficam com 0).
+    """
+
+    original: KnapsackProblem
+    problem: KnapsackProblem
+    core: List[int]
+    fixed: List[int]
+    dropped: int = 0
+    fixed_in: int = 0
+    fixed_out: int = 0
+    # fractional-relaxation bound and greedy value used for variable fixing (single-constraint only)
+    upper_bound: Optional[float] = None
+    lower_bound: Optional[int] = None
+    # items outside the core window were set to their LP value: the reduction is no longer exact
+    heuristic: bool = False
+
+    def expand(self, genes: Sequence[int]) -> List[int]:
+        """Genoma do problema original a partir dos genes do problema reduzido."""
+        full = list(self.fixed)
+        for i, gene in zip(self.core, genes):
+            full[i] = gene
+        return full
+
+    def summary(self) -> str:
+        text = (
+            f'Pré-processamento: {len(self.original)} → {len(self.core)} itens '
+            f'({self.fixed_in} fixados na mochila, {self.fixed_out} fixados fora, {self.dropped} descartados)'
+        )
+        if self.upper_bound is not None:
+            text += f'; limite LP={self.upper_bound:.1f}, guloso={self.lower_bound}'
+        if self.heuristic:
+            text += '; núcleo heurístico'
+        return text
+
+
+def _subproblem(problem: KnapsackProblem, core: List[int], capacity) -> KnapsackProblem:
+    pick = lambda row: [row[i] for i in core]
+    # names stay lazy: only read from disk if the selected items get printed
+    names = lambda: pick(problem.names) if problem.names is not None else None
+    return KnapsackProblem.from_arrays(
+        pick(problem.weights),
+        pick(problem.values),
+        capacity,
+        penalty_factor=problem.penalty_factor,
+        names=names,
+        extra_weights=[pick(row) for row in problem.dimensions[1:]],
+        knapsacks=1,
+    )
+
+
+def _reduce_multi(problem: KnapsackProblem) -> Reduction:
+    # several constraints: only items that fit in no knapsack (or add no value) can be dropped safely
+    fits_somewhere = lambda w: any(all(x <= c for x, c in zip(w, caps)) for caps in problem.capacities)
+    core = [i for i, w in enumerate(problem.item_weights) if problem.values[i] > 0 and fits_somewhere(w)]
+    return Reduction(
+        problem,
+        _subproblem(problem, core, problem.capacities),
+        core,
+        [0] * len(problem),
+        dropped=len(problem) - len(core),
+    )
+
+
+def reduce_problem(problem: KnapsackProblem, core_size: Optional[int] = None) -> Reduction:
+    """Reduz a instância antes do AG.
+
+    Descarta itens que nunca cabem ou sem valor, inclui os de peso zero e fixa variáveis pelo limite
+    da relaxação fracionária: se forçar o item para o lado oposto ao da solução LP deixa o limite abaixo
+    do valor guloso, nenhuma solução ótima o faz e o item é fixado (redução exata). Se o guloso já atinge
+    o limite LP, ele é ótimo e nada sobra para o AG. Com `core_size`, só os `core_size` itens indecisos em
+    torno do item crítico (na ordem valor/peso) vão para o AG; os demais recebem o valor da solução LP
+    (redução heurística, útil em instâncias correlacionadas, em que quase nada é fixado).
+    """
+    if problem.multi:
+        return _reduce_multi(problem)
+    n = len(problem)
+    weights, values, capacity = problem.weights, problem.values, problem.capacity
+    fixed = [0] * n
+    dropped = fixed_in = 0
+    base = 0
+    order = []
+    for i in problem.ratio_order:
+        if values[i] <= 0 or weights[i] > capacity:
+            dropped += 1
+        elif weights[i] == 0:
+            fixed[i] = 1
+            fixed_in += 1
+            base += values[i]
+        else:
+            order.append(i)
+
+    # break item: the first one in ratio order that no longer fits in the LP solution
+    remaining, upper = capacity, float(base)
+    brk = len(order)
+    for pos, i in enumerate(order):
+        if weights[i] > remaining:
+            brk = pos
+            break
+        remaining -= weights[i]
+        upper += values[i]
+    # greedy lower bound: keep adding the items that still fit past the break item
+    lower, left = base, capacity
+    greedy = list(fixed)
+    for i in order:
+        if weights[i] <= left:
+            left -= weights[i]
+            lower += values[i]
+            greedy[i] = 1
+    if brk == len(order):
+        # everything fits: the LP solution is integral
+        for i in order:
+            fixed[i] = 1
+        return Reduction(problem, _subproblem(problem, [], 0), [], fixed, dropped, fixed_in + len(order), 0, upper, lower)
+
+    critical = order[brk]
+    upper += values[critical] * remaining / weights[critical]
+    if lower >= int(upper + 1e-9):
+        # the greedy solution reaches the LP bound: it is optimal
+        taken = sum(greedy) - fixed_in
+        return Reduction(problem, _subproblem(problem, [], 0), [], greedy, dropped, fixed_in + taken, len(order) - taken, upper, lower)
+    # prefix sums over the ratio order: the LP bound with one variable forced is a bisect away
+    prefix_w = list(accumulate((weights[i] for i in order), initial=0))
+    prefix_v = list(accumulate((values[i] for i in order), initial=0))
+
+    def lp_bound(cap: int) -> float:
+        # LP value of the first items in ratio order that fill `cap` (plus a fraction of the next one)
+        k = bisect_right(prefix_w, cap) - 1
+        bound = prefix_v[k]
+        if k < len(order):
+            bound += values[order[k]] * (cap - prefix_w[k]) / weights[order[k]]
+        return bound
+
+    undecided, fixed_out = [], 0
+    lp_side = []
+    tolerance = 1e-6 * max(1, lower)
+    for pos, i in enumerate(order):
+        if pos < brk:
+            # taken by the LP: bound without it (its capacity is freed for the items after the break)
+            flipped = base + lp_bound(capacity + weights[i]) - values[i]
+        elif pos > brk:
+            # left out by the LP: bound with it forced in (the prefix it competes with ends before it)
+            flipped = base + values[i] + lp_bound(capacity - weights[i])
+        # the tolerance keeps float rounding from fixing a variable the exact bound would not
+        if pos != brk and flipped < lower - tolerance:
+            if pos < brk:
+                fixed[i] = 1
+                fixed_in += 1
+            else:
+                fixed_out += 1
+            continue
+        undecided.append(i)
+        lp_side.append(pos < brk)
+
+    heuristic = False
+    if core_size is not None and len(undecided) > core_size:
+        center = undecided.index(critical)
+        start = min(max(0, center - core_size // 2), len(undecided) - core_size)
+        for k, i in enumerate(undecided):
+            if start <= k < start + core_size:
+                continue
+            if lp_side[k]:
+                fixed[i] = 1
+                fixed_in += 1
+            else:
+                fixed_out += 1
+        undecided = undecided[start:start + core_size]
+        heuristic = True
+
+    residual = capacity - sum(compress(weights, fixed))
+    core = sorted(undecided)
+    return Reduction(
+        problem,
+        _subproblem(problem, core, residual),
+        core,
+        fixed,
+        dropped,
+        fixed_in,
+        fixed_out,
+        upper,
+        lower,
+        heuristic,
+    )
@@ -1,32 +1,251 @@
+import hashlib
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from itertools import compress
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     name: Optional[str]
     weight: int
     value: int
+    # one weight per dimension in multi-dimensional instances (weights[0] == weight)
+    weights: Tuple[int, ...] = ()
+
+
+class ItemsView(Sequence):
+    """Visão somente leitura dos itens; cada Item é criado sob demanda (uso em exibição)."""
+
+    __slots__ = ('_problem',)
+
+    def __init__(self, problem: 'KnapsackProblem') -> None:
+        self._problem = problem
+
+    def __len__(self) -> int:
+        return len(self._problem.weights)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        p = self._problem
+        names = p.names
+        weights = tuple(row[index] for row in p.dimensions) if len(p.dimensions) > 1 else ()
+        return Item(names[index] if names is not None else None, p.weights[index], p.values[index], weights)
+
+
+def _int_array(seq) -> Sequence[int]:
+    # lists/tuples become compact int64 arrays; buffers (array, memoryview/mmap, shared arrays) are kept without copying
+    if isinstance(seq, (list, tuple)) or not hasattr(seq, '__getitem__'):
+        return array('q', seq)
+    return seq
+
+
+def _capacity_matrix(capacity, dims: int, knapsacks: int) -> List[Tuple[int, ...]]:
+    # int (one dimension), one value per dimension, or one vector per knapsack -> knapsacks × dims
+    if isinstance(capacity, (list, tuple)) and capacity and isinstance(capacity[0], (list, tuple)):
+        if knapsacks not in (1, len(capacity)):
+            raise ValueError('knapsacks não confere com o número de vetores de capacidade.')
+        rows = [tuple(int(c) for c in row) for row in capacity]
+    elif isinstance(capacity, (list, tuple)):
+        rows = [tuple(int(c) for c in capacity)] * knapsacks
+    else:
+        rows = [(int(capacity),)] * knapsacks
+    if any(len(row) != dims for row in rows):
+        raise ValueError(f'A capacidade deve ter um valor por dimensão de peso ({dims}).')
+    return rows
 
 
 class KnapsackProblem:
 
     def __init__(self, items: List[Item], capacity: int, penalty_factor: float = 10.0):
-        self.items = items
-        self.capacity = capacity
+        self._init(
+            array('q', (it.weight for it in items)),
+            array('q', (it.value for it in items)),
+            capacity,
+            penalty_factor,
+            [it.name for it in items],
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        weights: Sequence[int],
+        values: Sequence[int],
+        capacity: int,
+        penalty_factor: float = 10.0,
+        names: Union[Sequence[Optional[str]], Callable[[], Sequence[Optional[str]]], None] = None,
+        extra_weights: Optional[Sequence[Sequence[int]]] = None,
+        knapsacks: int = 1,
+    ) -> 'KnapsackProblem':
+        """Constrói o problema direto de arrays de pesos/valores, sem criar objetos Item.
+
+        `names` pode ser uma sequência ou uma função chamada apenas quando os nomes forem exibidos.
+        `extra_weights` traz uma linha de pesos por dimensão adicional (volume, orçamento...); então
+        `capacity` é um vetor com um valor por dimensão, ou uma lista de vetores, um por mochila.
+        Com `knapsacks` > 1 (ou vários vetores), cada gene diz em qual mochila o item está (0 = fora).
+        """
+        if len(weights) != len(values):
+            raise ValueError('weights e values devem ter o mesmo tamanho.')
+        rows = [_int_array(row) for row in extra_weights or ()]
+        if any(len(row) != len(weights) for row in rows):
+            raise ValueError('Cada dimensão de peso deve ter um valor por item.')
+        problem = cls.__new__(cls)
+        problem._init(_int_array(weights), _int_array(values), capacity, penalty_factor, names, rows, knapsacks)
+        return problem
+
+    def _init(self, weights, values, capacity, penalty_factor: float, names, extra_weights=(), knapsacks: int = 1) -> None:
+        self.weights = weights
+        self.values = values
         self.penalty_factor = penalty_factor
+        self._names = names
+        # weight matrix (one row per dimension, row 0 is `weights`) and capacity matrix (knapsacks × dimensions)
+        self.dimensions = [weights, *extra_weights]
+        self.capacities = _capacity_matrix(capacity, len(self.dimensions), int(knapsacks))
+        self.bins = len(self.capacities)
+        if not 1 <= self.bins <= 255:
+            raise ValueError('O número de mochilas deve estar entre 1 e 255.')
+        self.multi = len(self.dimensions) > 1 or self.bins > 1
+        self._item_weights: Optional[List[Tuple[int, ...]]] = None
+        # scalar capacity of the first dimension, summed over the knapsacks (display, exact-solver estimates)
+        self.capacity = sum(row[0] for row in self.capacities)
+        if self.multi:
+            self._flat_capacities = [c for row in self.capacities for c in row]
+            # bytes.translate tables: gene byte == k -> 1, anything else -> 0 (selector of knapsack k)
+            self._bin_tables = [bytes(int(g == k) for g in range(256)) for k in range(1, self.bins + 1)]
+            totals = [sum(c) for c in zip(*self.capacities)]
+            self._scales = [1.0 / c if c > 0 else float('inf') for c in totals]
+        # item indices by value/weight ratio, best first; computed once and walked by repair
+        self.ratio_order = sorted(range(len(weights)), key=self.ratio, reverse=True)
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    @property
+    def items(self) -> ItemsView:
+        return ItemsView(self)
 
-    def evaluate(self, individual: List[int]) -> Tuple[float, int, int]:
-        total_weight = 0
-        total_value = 0
-        for gene, item in zip(individual, self.items):
-            if gene:
-                total_weight += item.weight
-                total_value += item.value
+    @property
+    def names(self) -> Optional[Sequence[Optional[str]]]:
+        if callable(self._names):
+            self._names = self._names()
+        return self._names
 
+    @property
+    def item_weights(self) -> List[Tuple[int, ...]]:
+        """Vetor de pesos de cada item (uma tupla por item), usado nas atualizações incrementais de carga."""
+        if self._item_weights is None:
+            self._item_weights = list(zip(*self.dimensions))
+        return self._item_weights
+
+    def fingerprint(self) -> str:
+        """Hash da instância (capacidade, pesos e valores), estável entre execuções."""
+        h = hashlib.sha256(str(self.capacities if self.multi else self.capacity).encode())
+        for row in self.dimensions:
+            h.update(array('q', row).tobytes())
+        h.update(array('q', self.values).tobytes())
+        return h.hexdigest()
+
+    def ratio(self, index: int) -> float:
+        if self.multi:
+            # value per unit of weight normalized by the total capacity of each dimension
+            weight = sum(row[index] * scale for row, scale in zip(self.dimensions, self._scales) if row[index])
+        else:
+            weight = self.weights[index]
+        return self.values[index] / weight if weight > 0 else float('inf')
+
+    def fits(self, loads: Sequence[int], index: int, knapsack: int) -> bool:
+        """Se o item cabe na mochila `knapsack` (0-based) com as cargas atuais (lista plana mochilas × dimensões)."""
+        base = knapsack * len(self.dimensions)
+        caps = self._flat_capacities
+        return all(loads[base + k] + w <= caps[base + k] for k, w in enumerate(self.item_weights[index]))
+
+    def _multi_first_fit(self, stop_at_first_miss: bool) -> List[int]:
+        genes = [0] * len(self)
+        loads = [0] * len(self._flat_capacities)
+        dims = len(self.dimensions)
+        for i in self.ratio_order:
+            for b in range(self.bins):
+                if self.fits(loads, i, b):
+                    genes[i] = b + 1
+                    for k, w in enumerate(self.item_weights[i]):
+                        loads[b * dims + k] += w
+                    break
+            else:
+                if stop_at_first_miss:
+                    break
+        return genes
+
+    def greedy_solution(self) -> List[int]:
+        """Guloso por razão valor/peso: adiciona cada item que ainda couber, do melhor para o pior."""
+        if self.multi:
+            return self._multi_first_fit(False)
+        genes = [0] * len(self)
+        remaining = self.capacity
+        for i in self.ratio_order:
+            if self.weights[i] <= remaining:
+                genes[i] = 1
+                remaining -= self.weights[i]
+        return genes
+
+    def lp_rounding(self) -> List[int]:
+        """Solução da relaxação linear arredondada para baixo: itens antes do item crítico (break item)."""
+        if self.multi:
+            return self._multi_first_fit(True)
+        genes = [0] * len(self)
+        remaining = self.capacity
+        for i in self.ratio_order:
+            if self.weights[i] > remaining:
+                break
+            genes[i] = 1
+            remaining -= self.weights[i]
+        return genes
+
+    def evaluate(self, individual: Union[Sequence[int], int]) -> Tuple[float, int, int]:
+        """Aceita lista/array/bytes com um gene por posição, ou um int com genes empacotados em bits (bit i = item i)."""
+        if self.multi:
+            loads = self.loads(individual)
+            return self.score_loads(sum(compress(self.values, individual)), loads)
+        if isinstance(individual, int):
+            total_weight = total_value = 0
+            bits = individual
+            while bits:
+                low = bits & -bits
+                i = low.bit_length() - 1
+                total_weight += self.weights[i]
+                total_value += self.values[i]
+                bits ^= low
+        else:
+            total_weight = sum(compress(self.weights, individual))
+            total_value = sum(compress(self.values, individual))
+
+        return self.score(total_value, total_weight)
+
+    def score(self, total_value: int, total_weight: int) -> Tuple[float, int, int]:
         if total_weight <= self.capacity:
             fitness = float(total_value)
         else:
             fitness = -1e9
 
         return fitness, total_value, total_weight
+
+    def loads(self, genes: Sequence[int], start: int = 0) -> List[int]:
+        """Carga de cada mochila em cada dimensão (lista plana mochilas × dimensões), via compress em C.
+
+        Com `start`, `genes` é o trecho de genes dos itens start, start+1, ... (atualizações incrementais).
+        """
+        if self.bins == 1:
+            selectors = [genes]
+        else:
+            raw = bytes(genes)
+            selectors = [raw.translate(table) for table in self._bin_tables]
+        if start:
+            end = start + len(genes)
+            return [sum(compress(row[start:end], sel)) for sel in selectors for row in self.dimensions]
+        return [sum(compress(row, sel)) for sel in selectors for row in self.dimensions]
+
+    def score_loads(self, total_value: int, loads: Sequence[int]) -> Tuple[float, int, int]:
+        """Como score, para cargas multidimensionais; o peso devolvido é o total da primeira dimensão."""
+        dims = len(self.dimensions)
+        feasible = all(l <= c for l, c in zip(loads, self._flat_capacities))
+        return (float(total_value) if feasible else -1e9), total_value, sum(loads[::dims])
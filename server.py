@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""Serviço HTTP local (somente stdlib): fila de jobs, pool de processos e instâncias mantidas em cache entre requisições."""
+import io
+import json
+import os
+import signal
+import sys
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+ROOT = os.path.abspath(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import json_utils
+from problem.problem import KnapsackProblem
+from problem.preprocessing import reduce_problem
+from algorithms.ga import REPLACEMENTS, REPRESENTATIONS, SEEDINGS
+from algorithms.history import HISTORY_POLICIES
+from algorithms.operators import CROSSOVERS, MUTATIONS, REPAIRS, SELECTIONS
+from algorithms.exact import SOLVERS, choose_solver
+from json_utils import get_cached, instance_from_dict, load_instance
+from main import ENGINES, EXACT_SOLVERS, choose_parameters, load_problem_from_json, run_exact, run_ga
+
+# request field -> (type, default)
+PARAMS = {
+    'capacity': (int, None),
+    'solver': (str, 'ga'),
+    'auto': (bool, False),
+    'pop_size': (int, 80),
+    'generations': (int, 150),
+    'mutation_rate': (float, 0.02),
+    'max_time': (float, 5.0),
+    'engine': (str, 'list'),
+    'representation': (str, 'list'),
+    'seeding': (str, 'random'),
+    'seed_fraction': (float, 0.1),
+    'adaptive': (bool, False),
+    'selection': (str, 'tournament'),
+    'crossover': (str, 'one_point'),
+    'mutation': (str, 'flip'),
+    'repair': (str, 'ratio'),
+    'dedup': (bool, False),
+    'diversity_metrics': (bool, False),
+    'restart_threshold': (float, None),
+    'replacement': (str, 'generational'),
+    'replace_count': (int, None),
+    'preprocess': (bool, False),
+    'core_size': (int, None),
+    'history': (bool, False),
+    'history_limit': (int, None),
+    'history_policy': (str, 'ring'),
+}
+CHOICES = {
+    'solver': SOLVERS,
+    'engine': tuple(ENGINES),
+    'representation': REPRESENTATIONS,
+    'seeding': SEEDINGS,
+    'replacement': REPLACEMENTS,
+    'history_policy': HISTORY_POLICIES,
+    'selection': tuple(SELECTIONS),
+    'crossover': tuple(CROSSOVERS),
+    'mutation': tuple(MUTATIONS),
+    'repair': tuple(REPAIRS),
+}
+
+
+class QueueFull(Exception):
+    pass
+
+
+def parse_params(data: dict) -> dict:
+    """Valida os parâmetros do job, completando com os padrões do main.py."""
+    if not isinstance(data, dict):
+        raise ValueError("'params' deve ser um objeto JSON.")
+    unknown = sorted(set(data) - set(PARAMS))
+    if unknown:
+        raise ValueError(f"Parâmetros desconhecidos: {', '.join(unknown)}.")
+    params = {}
+    for key, (kind, default) in PARAMS.items():
+        value = data.get(key, default)
+        if value is not None:
+            if kind is bool:
+                if not isinstance(value, bool):
+                    raise ValueError(f"'{key}' deve ser true ou false.")
+            else:
+                try:
+                    value = kind(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"'{key}' inválido.")
+            if key in CHOICES and value not in CHOICES[key]:
+                raise ValueError(f"'{key}' inválido: use um de {', '.join(CHOICES[key])}.")
+        params[key] = value
+    return params
+
+
+# per-worker problems built from cached instances: (path, capacity) -> (instance, problem)
+_problems: OrderedDict = OrderedDict()
+_PROBLEM_CACHE_SIZE = 16
+_WORKER_DIED = 'o processo do worker terminou inesperadamente'
+
+
+def _init_worker(cache_bytes: int) -> None:
+    json_utils._cache.max_bytes = cache_bytes
+
+
+def _cached_problem(path: str, capacity: Optional[int]) -> KnapsackProblem:
+    """Problema pronto (ordem por razão, impressão digital etc. já calculadas) enquanto a instância estiver no cache."""
+    instance = load_instance(path)
+    key = (path, capacity)
+    entry = _problems.get(key)
+    if entry is not None and entry[0] is instance:
+        _problems.move_to_end(key)
+        return entry[1]
+    problem = load_problem_from_json(path, capacity)
+    _problems[key] = (instance, problem)
+    # drop problems whose instance left the instance cache (file changed or evicted), so they do not pin it
+    for other in [k for k, (inst, _) in _problems.items() if get_cached(k[0]) is not inst]:
+        del _problems[other]
+    while len(_problems) > _PROBLEM_CACHE_SIZE:
+        _problems.popitem(last=False)
+    return problem
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+def solve_job(source: dict, params: dict) -> dict:
+    """Executa um job em um processo do pool. Instâncias por caminho ficam no cache de json_utils desse processo."""
+    start = time.perf_counter()
+    cache_hit = False
+    log = io.StringIO()
+    # run_ga/run_exact report on stdout; each worker runs one job at a time, so redirecting is safe
+    with redirect_stdout(log):
+        if 'path' in source:
+            path = source['path']
+            cache_hit = get_cached(path) is not None
+            if load_instance(path).capacity is None and params['capacity'] is None:
+                raise ValueError("instância sem 'capacity' e 'capacity' não informado no job")
+            problem = _cached_problem(path, params['capacity'])
+        else:
+            instance = source['instance']
+            capacity = instance.capacity or params['capacity']
+            if capacity is None:
+                raise ValueError("instância sem 'capacity' e 'capacity' não informado no job")
+            problem = KnapsackProblem.from_arrays(instance.weights, instance.values, capacity, names=instance.names,
+                                                  extra_weights=instance.extra_weights, knapsacks=instance.knapsacks)
+        load_time = time.perf_counter() - start
+
+        solver = params['solver']
+        if solver == 'auto':
+            solver = choose_solver(problem, params['max_time'])
+        result = None
+        if solver in EXACT_SOLVERS and problem.multi:
+            print('Solvers exatos não suportam várias dimensões ou mochilas. Executando o AG.')
+            solver = 'ga'
+        if solver in EXACT_SOLVERS:
+            try:
+                best, total_value, total_weight, exact = run_exact(problem, solver, max_time=params['max_time'])
+                result = {'generations': 0, 'proven_optimal': exact.proven_optimal}
+            except TimeoutError as exc:
+                print(f'{exc} Executando o AG.')
+                solver = 'ga'
+        if result is None:
+            reduction = None
+            if params['preprocess'] or params['core_size']:
+                reduction = reduce_problem(problem, core_size=params['core_size'])
+                print(reduction.summary())
+            ga_problem = reduction.problem if reduction is not None else problem
+            if params['auto']:
+                pop_size, generations, mutation_rate = choose_parameters(ga_problem.items, ga_problem.capacity)
+            else:
+                pop_size, generations, mutation_rate = params['pop_size'], params['generations'], params['mutation_rate']
+            best, total_value, total_weight, ga = run_ga(
+                problem, pop_size, generations, mutation_rate, record_history=params['history'], print_history=False,
+                max_time=params['max_time'], engine=params['engine'], representation=params['representation'],
+                seeding=params['seeding'], seed_fraction=params['seed_fraction'], adaptive=params['adaptive'],
+                selection=params['selection'], crossover=params['crossover'], mutation=params['mutation'], repair=params['repair'],
+                dedup=params['dedup'], diversity_metrics=params['diversity_metrics'], restart_threshold=params['restart_threshold'],
+                replacement=params['replacement'], replace_count=params['replace_count'], reduction=reduction,
+                history_limit=params['history_limit'], history_policy=params['history_policy'],
+            )
+            result = {'generations': ga.generations_run, 'proven_optimal': False}
+            if reduction is not None:
+                result['core_items'] = len(reduction.core)
+            if params['history']:
+                result['history'] = list(ga.history)
+    if problem.multi:
+        # knapsack of each selected item (1-based) and the loads per knapsack and dimension
+        result['knapsacks'] = [int(best[i]) for i, bit in enumerate(best) if bit]
+        result['loads'] = problem.loads(best)
+        result['capacities'] = [list(row) for row in problem.capacities]
+
+    result.update(
+        solver=solver,
+        n_items=len(problem),
+        capacity=problem.capacity,
+        best_value=total_value,
+        best_weight=total_weight,
+        selected=[i for i, bit in enumerate(best) if bit],
+        cache_hit=cache_hit,
+        load_time=round(load_time, 6),
+        elapsed=round(time.perf_counter() - start, 6),
+        worker=os.getpid(),
+        log=log.getvalue(),
+    )
+    return result
+
+
+class SolverService:
+    """Fila de jobs limitada na frente de workers de processo único, com registro de status e métricas de vazão.
+
+    Os jobs esperam numa fila própria e só vão a um worker quando ele está livre, de modo que jobs
+    na fila podem ser cancelados e o status 'running' é exato. Jobs por caminho vão ao worker "de casa"
+    do arquivo (hash do caminho), para que cada instância fique em cache em um só processo; jobs do
+    mesmo arquivo rodam um após o outro, enquanto os demais workers atendem outros arquivos e jobs inline.
+    Um worker que morre (falta de memória, sinal) é recriado e o job em execução termina com erro.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_queue: int = 64, cache_bytes: int = 256 * 1024 * 1024, max_jobs: int = 1000) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.max_jobs = max_jobs
+        self.cache_bytes = cache_bytes
+        # one single-process executor per worker, so jobs can be routed and a dead worker replaced alone
+        self._pools: list = [None] * self.workers
+        self._busy: set = set()
+        self._cond = threading.Condition()
+        self._jobs: OrderedDict[str, dict] = OrderedDict()
+        self._queue: deque = deque()  # (job id, source, params) waiting for a free worker
+        self._done_events: dict = {}
+        self._running = 0
+        self._closed = False
+        self._finished = deque(maxlen=1000)  # (completion time, elapsed) for the recent-throughput window
+        self.started = time.time()
+        self.counters = dict.fromkeys(('submitted', 'completed', 'failed', 'cancelled', 'rejected', 'cache_hits', 'cache_misses', 'worker_restarts'), 0)
+        # start the workers now, from the main thread, instead of forking from a request thread later
+        for i in range(self.workers):
+            self._pools[i] = self._new_worker()
+        threading.Thread(target=self._dispatch, daemon=True).start()
+
+    def submit(self, data: dict) -> dict:
+        if not isinstance(data, dict):
+            raise ValueError('Corpo do job deve ser um objeto JSON.')
+        if 'path' in data:
+            path = data['path']
+            if not isinstance(path, str) or not os.path.isfile(path):
+                raise ValueError(f'Arquivo não encontrado: {path}')
+            source = {'path': os.path.abspath(path)}
+        elif 'instance' in data:
+            source = {'instance': instance_from_dict(data['instance'])}
+        else:
+            raise ValueError("Informe 'path' (arquivo no servidor) ou 'instance' (JSON inline).")
+        params = parse_params(data.get('params', {}))
+
+        with self._cond:
+            if len(self._queue) >= self.max_queue:
+                self.counters['rejected'] += 1
+                raise QueueFull(f'Fila cheia ({self.max_queue} jobs aguardando).')
+            job_id = uuid.uuid4().hex[:12]
+            job = {
+                'id': job_id,
+                'status': 'queued',
+                'source': source.get('path', 'inline'),
+                'params': params,
+                'submitted': time.time(),
+            }
+            self._jobs[job_id] = job
+            self._done_events[job_id] = threading.Event()
+            self._queue.append((job_id, source, params))
+            self.counters['submitted'] += 1
+            self._prune()
+            self._cond.notify_all()
+            return dict(job)
+
+    def _new_worker(self) -> ProcessPoolExecutor:
+        pool = ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(self.cache_bytes,))
+        pool.submit(_warm_up).result()
+        return pool
+
+    def _home(self, source: dict) -> Optional[int]:
+        path = source.get('path')
+        return zlib.crc32(path.encode('utf-8')) % self.workers if path is not None else None
+
+    def _pick(self) -> Optional[tuple]:
+        """(posição na fila, worker) do próximo job a despachar, ou None. Chamado com o lock."""
+        free = [i for i in range(self.workers) if i not in self._busy]
+        if not free or not self._queue:
+            return None
+        for pos, (_, source, _) in enumerate(self._queue):
+            home = self._home(source)
+            if home is None:
+                return pos, free[0]
+            if home not in self._busy:
+                return pos, home
+        return None
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and (picked := self._pick()) is None:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                pos, worker = picked
+                job_id, source, params = self._queue[pos]
+                del self._queue[pos]
+                job = self._jobs[job_id]
+                job['status'] = 'running'
+                job['started'] = time.time()
+                self._running += 1
+                self._busy.add(worker)
+                pool = self._pools[worker]
+            if pool is None:
+                # the previous process of this slot died: start a new one (outside the lock)
+                pool = self._new_worker()
+                with self._cond:
+                    self._pools[worker] = pool
+                    self.counters['worker_restarts'] += 1
+            future = pool.submit(solve_job, source, params)
+            future.add_done_callback(lambda fut, job_id=job_id, worker=worker: self._finish(job_id, worker, fut))
+
+    def _finish(self, job_id: str, worker: int, future) -> None:
+        with self._cond:
+            self._running -= 1
+            self._busy.discard(worker)
+            self._cond.notify_all()
+            job = self._jobs[job_id]
+            job['finished'] = time.time()
+            exc = None if future.cancelled() else future.exception()
+            if isinstance(exc, BrokenProcessPool):
+                # the worker process is gone; the dispatcher starts a new one for this slot on its next job
+                dead, self._pools[worker] = self._pools[worker], None
+                if dead is not None:
+                    dead.shutdown(wait=False)
+            if future.cancelled() or exc is not None:
+                job['status'] = 'error'
+                if isinstance(exc, BrokenProcessPool):
+                    job['error'] = _WORKER_DIED
+                else:
+                    job['error'] = str(exc) if exc is not None else 'Serviço encerrado.'
+                self.counters['failed'] += 1
+            else:
+                result = future.result()
+                job['status'] = 'done'
+                job['result'] = result
+                self.counters['completed'] += 1
+                if job['source'] != 'inline':
+                    self.counters['cache_hits' if result['cache_hit'] else 'cache_misses'] += 1
+                self._finished.append((job['finished'], result['elapsed']))
+            self._done_events.pop(job_id).set()
+
+    def _prune(self) -> None:
+        # forget the oldest finished jobs once the registry is over its limit
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if job_id not in self._done_events:
+                del self._jobs[job_id]
+                excess -= 1
+
+    def get(self, job_id: str, wait: Optional[float] = None) -> Optional[dict]:
+        """Status do job; com `wait`, espera até esse número de segundos pelo término."""
+        with self._cond:
+            done = self._done_events.get(job_id)
+        if done is not None and wait:
+            done.wait(wait)
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def cancel(self, job_id: str) -> Optional[dict]:
+        """Cancela um job ainda na fila (jobs em execução não são interrompidos)."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job['status'] == 'queued':
+                self._queue = deque(entry for entry in self._queue if entry[0] != job_id)
+                job['status'] = 'cancelled'
+                job['finished'] = time.time()
+                self.counters['cancelled'] += 1
+                self._done_events.pop(job_id).set()
+            return dict(job)
+
+    def list_jobs(self) -> list:
+        with self._cond:
+            return [{k: v for k, v in job.items() if k != 'result'} for job in self._jobs.values()]
+
+    def metrics(self) -> dict:
+        now = time.time()
+        with self._cond:
+            uptime = now - self.started
+            recent = [elapsed for finished, elapsed in self._finished if now - finished <= 60]
+            return {
+                **self.counters,
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'queued': len(self._queue),
+                'running': self._running,
+                'jobs_tracked': len(self._jobs),
+                'uptime': round(uptime, 3),
+                'jobs_per_sec': round(self.counters['completed'] / uptime, 6) if uptime > 0 else 0.0,
+                'jobs_last_minute': len(recent),
+                'avg_job_seconds_last_minute': round(sum(recent) / len(recent), 6) if recent else None,
+            }
+
+    def shutdown(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            pools = [pool for pool in self._pools if pool is not None]
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+class Handler(BaseHTTPRequestHandler):
+    service: SolverService = None  # set by serve()
+
+    def _send(self, status: int, payload) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _job_id(self, path: str) -> Optional[str]:
+        parts = path.strip('/').split('/')
+        return parts[1] if len(parts) == 2 and parts[0] == 'jobs' else None
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == '/health':
+            self._send(200, {'status': 'ok'})
+        elif url.path == '/metrics':
+            self._send(200, self.service.metrics())
+        elif url.path.rstrip('/') == '/jobs':
+            self._send(200, self.service.list_jobs())
+        elif self._job_id(url.path):
+            wait = parse_qs(url.query).get('wait', [None])[0]
+            try:
+                wait = float(wait) if wait is not None else None
+            except ValueError:
+                self._send(400, {'error': "'wait' deve ser um número de segundos."})
+                return
+            job = self.service.get(self._job_id(url.path), wait=wait)
+            self._send(200, job) if job is not None else self._send(404, {'error': 'Job não encontrado.'})
+        else:
+            self._send(404, {'error': 'Rota não encontrada.'})
+
+    def do_POST(self) -> None:
+        if urlsplit(self.path).path.rstrip('/') != '/jobs':
+            self._send(404, {'error': 'Rota não encontrada.'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            data = json.loads(self.rfile.read(length) or b'{}')
+            self._send(202, self.service.submit(data))
+        except QueueFull as exc:
+            self._send(503, {'error': str(exc)})
+        except ValueError as exc:
+            self._send(400, {'error': str(exc)})
+
+    def do_DELETE(self) -> None:
+        job_id = self._job_id(urlsplit(self.path).path)
+        job = self.service.cancel(job_id) if job_id else None
+        self._send(200, job) if job is not None else self._send(404, {'error': 'Job não encontrado.'})
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def serve(host: str, port: int, service: SolverService, verbose: bool = False) -> None:
+    Handler.service = service
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    httpd.verbose = verbose
+    print(f'Servindo em http://{host}:{httpd.server_address[1]} com {service.workers} workers (Ctrl+C para parar)', flush=True)
+    # stop the same way on SIGTERM (service managers, kill)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print('\nEncerrando.')
+    finally:
+        httpd.server_close()
+        service.shutdown()
+
+
+def main(argv: list[str]) -> int:
+    import argparse
+    p = argparse.ArgumentParser(description='Serviço HTTP local que resolve instâncias da mochila sob demanda.')
+    p.add_argument('--host', default='127.0.0.1', help='endereço de escuta (padrão: 127.0.0.1)')
+    p.add_argument('--port', type=int, default=8765, help='porta de escuta (0 escolhe uma livre)')
+    p.add_argument('--workers', type=int, default=None, help='processos resolvendo jobs em paralelo (padrão: nº de CPUs)')
+    p.add_argument('--max-queue', type=int, default=64, help='jobs aguardando worker livre antes de recusar novos com 503')
+    p.add_argument('--cache-mb', type=float, default=256, help='limite do cache de instâncias por worker, em MB')
+    p.add_argument('--max-jobs', type=int, default=1000, help='jobs concluídos mantidos para consulta')
+    p.add_argument('--verbose', action='store_true', help='registra cada requisição no stderr')
+    args = p.parse_args(argv)
+
+    service = SolverService(workers=args.workers, max_queue=args.max_queue, cache_bytes=int(args.cache_mb * 1024 * 1024), max_jobs=args.max_jobs)
+    serve(args.host, args.port, service, verbose=args.verbose)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))